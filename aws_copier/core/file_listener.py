@@ -1,25 +1,38 @@
 """File listener for incremental backup with .milo_backup.info tracking."""
 
 import asyncio
-import hashlib
+import concurrent.futures
 import json
 import logging
+import os
 import random
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import aiofiles
 from pathspec import PathSpec
 from tqdm import tqdm as sync_tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 
+from aws_copier.core.hashing import HASH_POOL_WORKERS, md5_file, run_in_hash_pool
 from aws_copier.core.ignore_rules import IGNORE_RULES
-from aws_copier.core.s3_manager import S3Manager
+from aws_copier.core.s3_manager import MULTIPART_THRESHOLD, S3Manager
 from aws_copier.models.simple_config import SimpleConfig
 
 logger = logging.getLogger(__name__)
 
+# .milo_backup.info schema: 2 = per-file {md5, size, mtime_ns} (PERF-01). Unversioned
+# manifests hold bare MD5 strings and are migrated entry-by-entry on load.
+BACKUP_INFO_VERSION = 2
+
+# Wall-clock limit for a single-PUT upload
+UPLOAD_TIMEOUT_SECONDS = 300
+
+# Multipart uploads get a deadline that scales with size, assuming at least this throughput
+LARGE_UPLOAD_MIN_BYTES_PER_SECOND = 1024 * 1024
+
 
 class FileListener:
     """Incremental backup scanner with .milo_backup.info tracking."""
@@ -36,10 +49,14 @@ class FileListener:
         self.backup_info_filename = ".milo_backup.info"
 
         # CONFIG-01: Semaphore wired to user-configured max_concurrent_uploads (default 10).
+        # Used for single-PUT uploads; multipart-sized files use large_upload_semaphore so
+        # a handful of huge files cannot starve the many small ones.
         self.upload_semaphore = asyncio.Semaphore(self.config.max_concurrent_uploads)
+        self.large_upload_semaphore = asyncio.Semaphore(self.config.max_concurrent_large_uploads)
 
-        # Separate semaphore for MD5 computation to avoid blocking uploads.
-        self.md5_semaphore = asyncio.Semaphore(10)
+        # Separate semaphore for MD5 computation to avoid blocking uploads. Sized to keep
+        # every hash-pool thread busy with one job queued behind it, not a fixed 10.
+        self.md5_semaphore = asyncio.Semaphore(HASH_POOL_WORKERS * 2)
 
         # ASYNC-03: per-folder asyncio.Lock registry. Protects read-modify-write on
         # .milo_backup.info against concurrent scan + real-time event hitting the same folder.
@@ -51,6 +68,13 @@ class FileListener:
         self._backup_info_cache: Dict[Path, Dict[str, Any]] = {}
         self._backup_info_mtime: Dict[Path, float] = {}
 
+        # Watch roots precomputed as (normcased "root/" prefix, root, S3 name) so mapping a
+        # path to its watch folder is a str.startswith per root instead of relative_to
+        # raising ValueError for every non-matching folder.
+        self._watch_roots: List[Tuple[str, Path, str]] = [
+            (self._root_prefix(wf), wf, self.config.get_s3_name_for_folder(wf)) for wf in self.config.watch_folders
+        ]
+
         # ASYNC-06 hook: active upload tasks tracked here so the shutdown drain can wait on them.
         # Tasks add themselves in _upload_files; done-callback discards them.
         self._active_upload_tasks: Set[asyncio.Task] = set()
@@ -82,21 +106,41 @@ class FileListener:
         return self._folder_locks[folder_path]
 
     def _migrate_entry(self, value: Any) -> Dict[str, Any]:
-        """Migrate old string backup-info entry to new {md5, mtime} dict format.
+        """Migrate an older backup-info entry to the {md5, size, mtime_ns} dict format.
 
-        D-01: Old entries (str MD5) are read as {md5: value, mtime: 0.0}. mtime=0.0
-        guarantees the next scan re-stats and writes the new format on first hit.
+        D-01: Old entries (str MD5, or {md5, mtime} dicts) are read with size=-1 and
+        mtime_ns=0. These never match a real stat, so the next scan re-hashes the file
+        once and writes the new format.
 
         Args:
-            value: Raw entry from .milo_backup.info (str for old format, dict for new)
+            value: Raw entry from .milo_backup.info (str or dict)
 
         Returns:
-            Dict with keys 'md5' (str) and 'mtime' (float)
+            Dict with keys 'md5' (str), 'size' (int) and 'mtime_ns' (int)
         """
         if isinstance(value, str):
-            return {"md5": value, "mtime": 0.0}
+            return {"md5": value, "size": -1, "mtime_ns": 0}
+        if "mtime_ns" not in value or "size" not in value:
+            return {"md5": value.get("md5"), "size": -1, "mtime_ns": 0}
         return value
 
+    def _stat_fingerprint(self, file_path: Union[Path, "os.DirEntry[str]"]) -> Dict[str, int]:
+        """Stat a file and return the (size, mtime_ns) pair used for the quick-check.
+
+        Args:
+            file_path: File to stat. An os.DirEntry reuses the stat cached by scandir
+                where the platform provides one (Windows) instead of a fresh syscall.
+
+        Returns:
+            Dict with keys 'size' and 'mtime_ns'. When the file cannot be stat'ed,
+            returns size=-1 / mtime_ns=0, which never matches a later scan.
+        """
+        try:
+            st = file_path.stat()
+        except OSError:
+            return {"size": -1, "mtime_ns": 0}
+        return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
     def _resolve_watch_root(self, folder_path: Path) -> Path:
         """Find the configured watch folder that is an ancestor of folder_path.
 
@@ -107,15 +151,40 @@ class FileListener:
             The watch root Path that contains folder_path, or folder_path itself
             as a fallback when no watch folder is an ancestor.
         """
-        for watch_folder in self.config.watch_folders:
-            try:
-                folder_path.relative_to(watch_folder)
-                return watch_folder
-            except ValueError:
-                continue
+        match = self._match_watch_root(folder_path)
+        if match is not None:
+            return match[0]
         # Fallback: treat folder_path itself as root (no ancestor cascade)
         return folder_path
 
+    @staticmethod
+    def _root_prefix(watch_folder: Path) -> str:
+        """Return the normcased watch-folder string with exactly one trailing separator."""
+        prefix = os.path.normcase(str(watch_folder))
+        return prefix if prefix.endswith(os.sep) else prefix + os.sep
+
+    def _match_watch_root(self, path: Path) -> Optional[Tuple[Path, str, str]]:
+        """Find the first configured watch folder containing path.
+
+        Comparison is on normcased strings (case-insensitive on Windows, like
+        PureWindowsPath.relative_to) against the precomputed root prefixes.
+
+        Args:
+            path: File or folder path
+
+        Returns:
+            Tuple of (watch root, S3 name for the root, path relative to the root with
+            native separators; "." for the root itself), or None if no root matches.
+        """
+        raw = str(path)
+        key = os.path.normcase(raw)
+        for prefix, root, s3_name in self._watch_roots:
+            if key.startswith(prefix):
+                return root, s3_name, raw[len(prefix) :]
+            if key + os.sep == prefix:
+                return root, s3_name, "."
+        return None
+
     def _load_backupignore_spec(self, folder_path: Path, watch_root: Path) -> PathSpec:
         """Accumulate .backupignore patterns from watch_root down to folder_path.
 
@@ -154,58 +223,149 @@ class FileListener:
         return PathSpec.from_lines("gitignore", all_patterns)
 
     async def scan_all_folders(self) -> None:
-        """Scan all configured watch folders using incremental backup approach."""
+        """Scan all configured watch folders concurrently using incremental backup approach."""
         logger.info("Starting incremental backup scan of all watch folders")
 
-        with logging_redirect_tqdm():
-            for folder_path in self.config.watch_folders:
-                if not folder_path.exists():
-                    logger.warning(f"Watch folder does not exist: {folder_path}")
-                    continue
+        valid_folders: List[Path] = []
+        for folder_path in self.config.watch_folders:
+            if not folder_path.exists():
+                logger.warning(f"Watch folder does not exist: {folder_path}")
+                continue
 
-                if not folder_path.is_dir():
-                    logger.warning(f"Watch path is not a directory: {folder_path}")
-                    continue
+            if not folder_path.is_dir():
+                logger.warning(f"Watch path is not a directory: {folder_path}")
+                continue
 
-                logger.info(f"Processing folder: {folder_path}")
-                await self._process_folder_recursively(folder_path)
+            logger.info(f"Processing folder: {folder_path}")
+            valid_folders.append(folder_path)
+
+        with logging_redirect_tqdm():
+            # Watch folders are scanned concurrently: roots on different disks walk and hash
+            # in parallel, while the shared md5/upload semaphores keep total load bounded.
+            results = await asyncio.gather(
+                *(self._process_folder_recursively(folder_path) for folder_path in valid_folders),
+                return_exceptions=True,
+            )
+        for folder_path, result in zip(valid_folders, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error processing folder {folder_path}: {result}")
+                self._stats["errors"] += 1
 
         logger.info(f"Incremental backup completed. Stats: {self._stats}")
 
     async def _process_folder_recursively(self, folder_path: Path) -> None:
-        """Process a folder and all its subfolders recursively.
+        """Process a folder and all its subfolders.
+
+        The tree is traversed by a flat os.walk (see _walk) on a worker thread that
+        feeds folders into a bounded queue; config.scan_workers consumers run _process_current_folder on
+        them, so hashing and uploads in one folder overlap with the next folders.
 
         Args:
             folder_path: Path to folder to process
         """
+        # Skip ignored directories (IGNORE-03: delegate to IGNORE_RULES)
+        if IGNORE_RULES.should_ignore_dir(folder_path):
+            return
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1024)
+        stop = threading.Event()
+        workers = [asyncio.create_task(self._scan_worker(queue)) for _ in range(self.config.scan_workers)]
         try:
-            # Skip ignored directories (IGNORE-03: delegate to IGNORE_RULES)
-            if IGNORE_RULES.should_ignore_dir(folder_path):
-                return
+            # The blocking os.walk runs on a worker thread so listing a large tree never
+            # stalls the event loop (watcher callbacks, uploads in flight).
+            await asyncio.to_thread(self._walk_into_queue, folder_path, queue, asyncio.get_running_loop(), stop)
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        except Exception as e:
+            logger.error(f"Error processing folder {folder_path}: {e}")
+            self._stats["errors"] += 1
+        finally:
+            # Unblocks the walker thread if we were cancelled while it waited for room
+            stop.set()
+            for worker in workers:
+                if not worker.done():
+                    worker.cancel()
+
+    def _walk_into_queue(
+        self,
+        root: Path,
+        queue: asyncio.Queue,
+        loop: asyncio.AbstractEventLoop,
+        stop: threading.Event,
+    ) -> None:
+        """Run _walk on the calling (worker) thread and hand each folder to the event loop.
 
-            logger.info(f"Processing folder: {folder_path}")
-            self._stats["scanned_folders"] += 1
+        Each put is scheduled on the loop and waited for, so the bounded queue applies
+        back-pressure to the walk. Returns early once stop is set.
 
-            # Step 1: Process current folder
-            await self._process_current_folder(folder_path)
+        Args:
+            root: Folder to walk
+            queue: Bounded scan queue consumed by _scan_worker tasks
+            loop: Event loop that owns queue
+            stop: Set by the caller when the scan is abandoned
+        """
+        for current in self._walk(root):
+            try:
+                future = asyncio.run_coroutine_threadsafe(queue.put(current), loop)
+            except RuntimeError:
+                return  # loop closed
+            while True:
+                try:
+                    future.result(timeout=0.5)
+                    break
+                except concurrent.futures.TimeoutError:
+                    if stop.is_set():
+                        future.cancel()
+                        return
+                except concurrent.futures.CancelledError:
+                    return
+
+    def _walk(self, root: Path) -> Iterator[Path]:
+        """Yield root and every non-ignored subfolder beneath it.
+
+        Ignored directories are pruned in place so os.walk never descends into them;
+        symlinked directories are not followed. Subfolders are visited in random order
+        so each run covers a different slice of the tree first, preventing starvation
+        of deep dirs.
+
+        Args:
+            root: Watch folder (or subfolder) to walk
+
+        Yields:
+            Each folder to process, parents before children
+        """
+
+        def _on_error(error: OSError) -> None:
+            if isinstance(error, PermissionError):
+                logger.warning(f"Permission denied accessing folder: {error.filename}")
+            else:
+                logger.error(f"Error scanning subfolders in {error.filename}: {error}")
 
-            # Step 2: Process all subfolders recursively in random order so each run
-            # covers a different slice of the tree first, preventing starvation of deep dirs.
+        for dirpath, dirnames, _filenames in os.walk(root, onerror=_on_error):
+            dirnames[:] = [d for d in dirnames if not IGNORE_RULES.should_ignore_dir_name(d)]
+            random.shuffle(dirnames)
+            yield Path(dirpath)
+
+    async def _scan_worker(self, queue: asyncio.Queue) -> None:
+        """Consume folders from the scan queue until a None sentinel is received.
+
+        Args:
+            queue: Queue of folders produced by _process_folder_recursively
+        """
+        while True:
+            folder_path = await queue.get()
             try:
-                subdirs = [
-                    item for item in folder_path.iterdir() if item.is_dir() and not IGNORE_RULES.should_ignore_dir(item)
-                ]
-                random.shuffle(subdirs)
-                for item in subdirs:
-                    await self._process_folder_recursively(item)
-            except PermissionError:
-                logger.warning(f"Permission denied accessing folder: {folder_path}")
+                if folder_path is None:
+                    return
+                logger.info(f"Processing folder: {folder_path}")
+                self._stats["scanned_folders"] += 1
+                await self._process_current_folder(folder_path)
             except Exception as e:
-                logger.error(f"Error scanning subfolders in {folder_path}: {e}")
-
-        except Exception as e:
-            logger.error(f"Error processing folder {folder_path}: {e}")
-            self._stats["errors"] += 1
+                logger.error(f"Error processing folder {folder_path}: {e}")
+                self._stats["errors"] += 1
+            finally:
+                queue.task_done()
 
     async def _process_current_folder(self, folder_path: Path) -> None:
         """Process files in current folder using incremental backup logic.
@@ -218,36 +378,32 @@ class FileListener:
         # Step 1: Load existing backup info
         existing_backup_info = await self._load_backup_info(backup_info_file)
 
-        # Step 2: Scan current files — pass existing_backup_info for PERF-01 mtime-skip
+        # Step 2: Scan current files — pass existing_backup_info for the PERF-01 quick-check
         watch_root = self._resolve_watch_root(folder_path)
         current_files = await self._scan_current_files(folder_path, existing_backup_info, watch_root)
 
         # Step 3: Compare with existing backup info
         files_to_upload = self._determine_files_to_upload(current_files, existing_backup_info)
 
-        # Step 4: Upload changed/new files; receive {filename: upload_mtime} for successful uploads
-        upload_mtimes = await self._upload_files(files_to_upload, folder_path)
-        uploaded_files = list(upload_mtimes.keys())
+        # Step 4: Upload changed/new files, reusing scan-time MD5s; receive {filename: entry}
+        # for successful uploads
+        upload_entries = await self._upload_files(files_to_upload, folder_path, current_files)
+        uploaded_files = list(upload_entries.keys())
 
         # Step 5: Update backup info file with successfully uploaded files only
         if uploaded_files:
             # Create updated backup info with only successfully uploaded files
             updated_backup_info: Dict[str, Any] = existing_backup_info.copy()
 
-            # Add/update entries for successfully uploaded files with upload-captured mtime (D-02)
+            # Add/update entries for successfully uploaded files with the MD5 that was actually
+            # uploaded and the size/mtime_ns captured just before upload (D-02)
             for filename in uploaded_files:
-                entry = current_files.get(filename)
-                if entry is not None:
-                    current_md5 = entry.get("md5") if isinstance(entry, dict) else entry
-                    updated_backup_info[filename] = {
-                        "md5": current_md5,
-                        "mtime": upload_mtimes[filename],
-                    }
+                updated_backup_info[filename] = upload_entries[filename]
 
             # Also include unchanged files that weren't uploaded (they're still valid)
             for filename, entry in current_files.items():
                 if filename not in files_to_upload:  # File wasn't changed, keep existing info
-                    updated_backup_info[filename] = entry if isinstance(entry, dict) else {"md5": entry, "mtime": 0.0}
+                    updated_backup_info[filename] = entry if isinstance(entry, dict) else self._migrate_entry(entry)
 
             await self._update_backup_info(backup_info_file, updated_backup_info)
             logger.info(
@@ -267,15 +423,15 @@ class FileListener:
         """Load backup info with in-memory cache and silent format migration.
 
         PERF-02: Re-reads disk only when .milo_backup.info st_mtime changes.
-        PERF-01 / D-01: Migrates old string entries to {md5, mtime} dict on read.
+        PERF-01 / D-01: Migrates older entries to the {md5, size, mtime_ns} dict on read.
         ASYNC-03: Holds per-folder Lock during stat + read + cache update.
 
         Args:
             backup_info_file: Path to .milo_backup.info file
 
         Returns:
-            Dict mapping filename to {"md5": str, "mtime": float}. Empty dict if
-            the file does not exist or cannot be parsed.
+            Dict mapping filename to {"md5": str, "size": int, "mtime_ns": int}. Empty
+            dict if the file does not exist or cannot be parsed.
         """
         folder = backup_info_file.parent
         async with self._get_folder_lock(folder):
@@ -306,19 +462,20 @@ class FileListener:
         existing_backup_info: Optional[Dict[str, Dict[str, Any]]] = None,
         watch_root: Optional[Path] = None,
     ) -> Dict[str, Dict[str, Any]]:
-        """Scan current folder and compute MD5 for changed files; skip unchanged via mtime (PERF-01).
+        """Scan current folder and compute MD5 for changed files; skip unchanged via quick-check (PERF-01).
 
         Args:
             folder_path: Path to folder to scan
             existing_backup_info: Previously stored backup info dict (from _load_backup_info).
-                When provided, files whose st_mtime matches the stored mtime are skipped —
-                MD5 is not recomputed. Pass None or {} to force full recomputation.
+                When provided, files whose st_size and st_mtime_ns both match the stored
+                entry are skipped — the cached MD5 is reused instead of re-reading the file.
+                Pass None or {} to force full recomputation.
             watch_root: The ancestor watch root for this folder_path; used to build the
                 cascaded .backupignore PathSpec (CONFIG-06). Defaults to folder_path
                 itself when not provided (no ancestor cascade).
 
         Returns:
-            Dictionary mapping filename to {"md5": str, "mtime": float}
+            Dictionary mapping filename to {"md5": str, "size": int, "mtime_ns": int}
         """
         if existing_backup_info is None:
             existing_backup_info = {}
@@ -330,257 +487,526 @@ class FileListener:
 
         current_files: Dict[str, Dict[str, Any]] = {}
 
+        # CONFIG-06: .backupignore matches paths relative to watch_root with forward slashes
+        # (Pitfall 4). Resolve the folder's part once; each file then only appends its name
+        # instead of a relative_to() (and possible ValueError) per entry.
         try:
-            # Collect all files to process; apply mtime-skip before scheduling MD5 tasks
-            files_to_hash: List[Path] = []
-            for file_path in folder_path.iterdir():
-                if file_path.is_dir():
-                    continue
-                # IGNORE-03: delegate to IGNORE_RULES; IGNORE-04: count ignored files in stats
-                if IGNORE_RULES.should_ignore_file(file_path):
-                    self._stats["ignored_files"] += 1
-                    continue
-
-                # CONFIG-06: per-directory .backupignore filtering. Match input must be the
-                # path relative to watch_root with forward slashes (Pitfall 4).
-                try:
-                    relative = file_path.relative_to(watch_root)
-                except ValueError:
-                    relative = Path(file_path.name)
-                relative_str = str(relative).replace("\\", "/")
-                if backupignore_spec.match_file(relative_str):
-                    self._stats["ignored_files"] += 1
-                    continue
-
-                # PERF-01: check st_mtime before scheduling MD5 computation
-                try:
-                    stat = file_path.stat()
-                except OSError:
-                    # Cannot stat — fall through to MD5 computation
-                    files_to_hash.append(file_path)
-                    continue
-
-                entry = existing_backup_info.get(file_path.name)
-                if entry and entry.get("mtime") == stat.st_mtime:
-                    # mtime unchanged → skip MD5, carry forward existing entry
-                    self._stats["skipped_files"] += 1
-                    current_files[file_path.name] = entry
-                    continue
+            folder_relative = folder_path.relative_to(watch_root).as_posix()
+        except ValueError:
+            folder_relative = "."
+        relative_prefix = "" if folder_relative == "." else folder_relative + "/"
 
-                files_to_hash.append(file_path)
+        try:
+            # Directory read + per-file stat run on a worker thread: scan_workers folders
+            # list in parallel (overlapping getdents/stat on different directories) and a
+            # huge folder never stalls the event loop.
+            current_files, files_to_hash, ignored, skipped = await asyncio.to_thread(
+                self._list_folder_files, folder_path, existing_backup_info, backupignore_spec, relative_prefix
+            )
+            self._stats["ignored_files"] += ignored
+            self._stats["skipped_files"] += skipped
 
             if not files_to_hash:
                 return current_files
 
-            # Create tasks for parallel MD5 computation on files that need it
-            md5_tasks = []
-            for file_path in files_to_hash:
-                task = asyncio.create_task(self._calculate_md5_with_semaphore(file_path))
-                md5_tasks.append((file_path, task))
-
-            logger.debug(f"Computing MD5 for {len(files_to_hash)} files in parallel (max 50 concurrent)")
+            logger.debug(
+                f"Computing MD5 for {len(files_to_hash)} files in parallel (max {HASH_POOL_WORKERS} concurrent)"
+            )
 
-            # Gather all MD5 tasks concurrently; done callbacks tick the progress bar.
-            pbar = sync_tqdm(total=len(md5_tasks), desc=f"Hashing  {folder_path.name}", unit="file", leave=False)
-            for _, task in md5_tasks:
-                task.add_done_callback(lambda _f: pbar.update())
-            results = await asyncio.gather(*(task for _, task in md5_tasks), return_exceptions=True)
-            pbar.close()
-            for (file_path, _), result in zip(md5_tasks, results):
-                if isinstance(result, Exception):
-                    logger.error(f"Error computing MD5 for {file_path.name}: {result}")
-                    self._stats["errors"] += 1
-                elif result:
-                    # Store new dict format; mtime captured at scan time (D-02 note: upload
-                    # will re-capture mtime just before the upload call for uploaded files)
+            # Bounded worker pool fed by a queue: a fixed number of hashing tasks per folder
+            # instead of one Task per file. md5_semaphore still caps hashing across folders.
+            worker_count = min(len(files_to_hash), HASH_POOL_WORKERS * 2)
+            queue: asyncio.Queue = asyncio.Queue(maxsize=worker_count * 2)
+            pbar = sync_tqdm(total=len(files_to_hash), desc=f"Hashing  {folder_path.name}", unit="file", leave=False)
+
+            async def hash_worker() -> None:
+                while True:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    file_path, fingerprint = item
                     try:
-                        scan_mtime = file_path.stat().st_mtime
-                    except OSError:
-                        scan_mtime = 0.0
-                    current_files[file_path.name] = {"md5": result, "mtime": scan_mtime}
-                    self._stats["scanned_files"] += 1
-                else:
-                    self._stats["errors"] += 1
+                        result = await self._calculate_md5_with_semaphore(file_path)
+                    except Exception as e:
+                        logger.error(f"Error computing MD5 for {file_path.name}: {e}")
+                        self._stats["errors"] += 1
+                    else:
+                        if result:
+                            # Fingerprint captured at scan time (D-02 note: upload re-captures
+                            # it just before the upload call for uploaded files)
+                            current_files[file_path.name] = {"md5": result, **fingerprint}
+                            self._stats["scanned_files"] += 1
+                        else:
+                            self._stats["errors"] += 1
+                    pbar.update()
+
+            workers = [asyncio.create_task(hash_worker()) for _ in range(worker_count)]
+            try:
+                for item in files_to_hash:
+                    await queue.put(item)
+                for _ in workers:
+                    await queue.put(None)
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    if not worker.done():
+                        worker.cancel()
+                pbar.close()
 
         except Exception as e:
             logger.error(f"Error scanning files in {folder_path}: {e}")
 
         return current_files
 
+    def _list_folder_files(
+        self,
+        folder_path: Path,
+        existing_backup_info: Dict[str, Dict[str, Any]],
+        backupignore_spec: PathSpec,
+        relative_prefix: str,
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[Tuple[Path, Dict[str, int]]], int, int]:
+        """List one folder and split its files into quick-check hits and files to hash (blocking).
+
+        Runs on a worker thread, so it only returns counts; the caller adds them to
+        self._stats on the event loop.
+
+        Args:
+            folder_path: Path to folder to list
+            existing_backup_info: Stored backup info used for the PERF-01 quick-check
+            backupignore_spec: Cascaded .backupignore spec for this folder
+            relative_prefix: folder_path relative to its watch root, "" or ending in "/"
+
+        Returns:
+            Tuple of (entries carried forward unchanged, (path, fingerprint) pairs to hash,
+            ignored file count, quick-check skip count)
+
+        Raises:
+            OSError: If the folder cannot be listed
+        """
+        # Collect all files to process; apply the size+mtime_ns quick-check before
+        # scheduling MD5 tasks. The fingerprint is taken BEFORE hashing so a file
+        # modified mid-hash mismatches on the next scan and is re-hashed.
+        current_files: Dict[str, Dict[str, Any]] = {}
+        files_to_hash: List[Tuple[Path, Dict[str, int]]] = []
+        ignored = 0
+        skipped = 0
+        with os.scandir(folder_path) as it:
+            dir_entries = list(it)
+        for dir_entry in dir_entries:
+            # One type check from the cached dirent: subfolders, FIFOs, sockets and
+            # broken symlinks are skipped (a FIFO would block the hash read forever).
+            # Symlinks to regular files are still followed, as before.
+            try:
+                if not dir_entry.is_file():
+                    continue
+            except OSError:
+                continue
+            # IGNORE-03: delegate to IGNORE_RULES; IGNORE-04: count ignored files in stats.
+            # Name-only check on the DirEntry strings: no Path is built while filtering.
+            if IGNORE_RULES.should_ignore_file_name(dir_entry.name):
+                ignored += 1
+                continue
+
+            # CONFIG-06: per-directory .backupignore filtering
+            if backupignore_spec.match_file(relative_prefix + dir_entry.name):
+                ignored += 1
+                continue
+
+            # PERF-01: compare size + mtime_ns before scheduling MD5 computation.
+            # An unstat-able file gets size=-1 and always falls through to hashing.
+            fingerprint = self._stat_fingerprint(dir_entry)
+            name = dir_entry.name
+            entry = existing_backup_info.get(name)
+            if (
+                entry
+                and fingerprint["size"] >= 0
+                and entry.get("size") == fingerprint["size"]
+                and entry.get("mtime_ns") == fingerprint["mtime_ns"]
+            ):
+                # Quick-check matched → skip MD5, carry forward existing entry
+                skipped += 1
+                current_files[name] = entry
+                continue
+
+            # Only files that need hashing get a Path object
+            files_to_hash.append((Path(dir_entry.path), fingerprint))
+
+        return current_files, files_to_hash, ignored, skipped
+
+    @staticmethod
+    def _entry_md5(entry: Any) -> Optional[str]:
+        """Return the MD5 of a backup-info entry (bare MD5 string or {md5, ...} dict), else None."""
+        if isinstance(entry, str):
+            return entry
+        if isinstance(entry, dict):
+            return entry.get("md5")
+        return None
+
     def _determine_files_to_upload(
         self, current_files: Dict[str, Any], existing_backup_info: Dict[str, Any]
     ) -> List[str]:
         """Determine which files need to be uploaded.
 
-        Handles both the legacy string format and the new {md5, mtime} dict format
+        Handles both the legacy string format and the new {md5, size, mtime_ns} dict format
         in existing_backup_info — extracts the md5 key when the entry is a dict.
 
         Args:
-            current_files: Current files mapping filename to MD5 string or {md5, mtime} dict
-            existing_backup_info: Existing backup info mapping filename to MD5 string or {md5, mtime} dict
+            current_files: Current files mapping filename to MD5 string or {md5, size, mtime_ns} dict
+            existing_backup_info: Existing backup info mapping filename to MD5 string or {md5, size, mtime_ns} dict
 
         Returns:
             List of filenames that need to be uploaded
         """
-        files_to_upload = []
-
-        for filename, current_entry in current_files.items():
-            # Support both bare MD5 strings (pre-Task-2) and new {md5, mtime} dicts
-            current_md5 = current_entry if isinstance(current_entry, str) else current_entry.get("md5")
-            existing_entry = existing_backup_info.get(filename)
-            existing_md5 = (
-                existing_entry
-                if isinstance(existing_entry, str)
-                else (existing_entry.get("md5") if isinstance(existing_entry, dict) else None)
-            )
-
-            if existing_md5 != current_md5:
-                # File is new or has changed
-                files_to_upload.append(filename)
-            else:
-                # File unchanged
-                self._stats["skipped_files"] += 1
+        # Entries carried forward by the PERF-01 quick-check are the very same objects as
+        # in existing_backup_info, so an identity test settles them without extracting
+        # MD5s; only freshly hashed entries fall through to the MD5 comparison.
+        entry_md5 = self._entry_md5
+        files_to_upload = [
+            filename
+            for filename, current_entry in current_files.items()
+            if current_entry is not (existing_entry := existing_backup_info.get(filename))
+            and entry_md5(current_entry) != entry_md5(existing_entry)
+        ]
+        # Everything else is unchanged
+        self._stats["skipped_files"] += len(current_files) - len(files_to_upload)
 
         return files_to_upload
 
-    async def _upload_single_file(self, filename: str, folder_path: Path) -> Tuple[bool, float]:
-        """Upload a single file with semaphore control, capturing st_mtime just before upload (D-02).
+    async def _upload_single_file(
+        self,
+        filename: str,
+        folder_path: Path,
+        scanned_entry: Optional[Dict[str, Any]] = None,
+        prechecked: bool = False,
+        large: Optional[bool] = None,
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """Upload a single file with semaphore control, capturing size/mtime_ns just before upload (D-02).
 
         Args:
             filename: Name of file to upload
             folder_path: Path to folder containing the files
+            scanned_entry: {md5, size, mtime_ns} entry produced by _scan_current_files. When
+                its size/mtime_ns still match the file on disk, its MD5 is reused instead of
+                hashing the file a second time. None always recomputes.
+            prechecked: True when scanned_entry's MD5 was already checked against S3 (by
+                the bulk check in _upload_files) and found missing or different. The
+                per-file HEAD is then skipped if the scan-time MD5 is still current.
+            large: Whether the file goes through multipart upload, if the caller already
+                knows. None classifies it here via _is_large_upload.
 
         Returns:
-            Tuple of (success: bool, upload_mtime: float). upload_mtime is the st_mtime
-            captured immediately before the upload call, so a file modified during upload
-            is detected on the next scan cycle. Returns (False, 0.0) on any failure.
+            Tuple of (success: bool, entry: {"md5", "size", "mtime_ns"}). size/mtime_ns are
+            captured before the MD5 is (re)validated and the upload starts, so a file modified
+            during upload is detected on the next scan cycle. Returns (False, {}) on any failure.
         """
-        async with self.upload_semaphore:
-            file_path = folder_path / filename
+        file_path = folder_path / filename
+        # Pick the size-class semaphore; the scan entry's size avoids an extra stat
+        if large is None:
+            large = self._is_large_upload(file_path, scanned_entry)
+        if large:
+            semaphore = self.large_upload_semaphore
+        else:
+            semaphore = self.upload_semaphore
 
+        async with semaphore:
             logger.info(f"Uploading file: {file_path}")
             try:
                 # Build S3 key relative to watch folder root
                 s3_key = self._build_s3_key(file_path)
 
-                # Calculate local MD5
-                local_md5 = await self._calculate_md5(file_path)
+                # D-02: capture size/mtime_ns before upload so a file modified during
+                # upload is detected on the next cycle (we record what we actually uploaded).
+                upload_fingerprint = self._stat_fingerprint(file_path)
+
+                # Reuse the scan-time MD5 when the file is unchanged since the scan;
+                # otherwise (or when called without a scan entry) hash it now.
+                local_md5 = None
+                md5_reused = False
+                if (
+                    isinstance(scanned_entry, dict)
+                    and upload_fingerprint["size"] >= 0
+                    and scanned_entry.get("size") == upload_fingerprint["size"]
+                    and scanned_entry.get("mtime_ns") == upload_fingerprint["mtime_ns"]
+                ):
+                    local_md5 = scanned_entry.get("md5")
+                    md5_reused = bool(local_md5)
+                if not local_md5:
+                    local_md5 = await self._calculate_md5(file_path)
                 if not local_md5:
                     logger.error(f"Failed to calculate MD5 for {file_path}")
                     self._stats["errors"] += 1
-                    return False, 0.0
+                    return False, {}
 
-                # Check if file exists in S3 with same MD5
-                if await self.s3_manager.check_exists(s3_key, local_md5):
+                upload_entry = {"md5": local_md5, **upload_fingerprint}
+
+                # Check if file exists in S3 with same MD5 (unless the bulk pre-check
+                # already answered that for this exact MD5)
+                if not (prechecked and md5_reused) and await self.s3_manager.check_exists(s3_key, local_md5):
                     logger.info(f"File already exists in S3 with same MD5: {s3_key}")
                     self._stats["skipped_files"] += 1
-                    # Capture mtime for already-synced file so it can be recorded
-                    try:
-                        upload_mtime = file_path.stat().st_mtime
-                    except OSError:
-                        upload_mtime = 0.0
-                    return True, upload_mtime
-
-                # D-02: capture st_mtime just before upload so a file modified during upload
-                # is detected on the next cycle (we record what we actually uploaded).
-                try:
-                    upload_mtime = file_path.stat().st_mtime
-                except OSError:
-                    upload_mtime = 0.0
+                    return True, upload_entry
 
                 # Upload file
                 if await self.s3_manager.upload_file(file_path, s3_key, precomputed_md5=local_md5):
                     self._stats["uploaded_files"] += 1
                     logger.info(f"Uploaded: {file_path} -> {s3_key}")
-                    return True, upload_mtime
+                    return True, upload_entry
                 else:
                     logger.error(f"Failed to upload: {file_path}")
                     self._stats["errors"] += 1
-                    return False, 0.0
+                    return False, {}
 
             except Exception as e:
                 logger.error(f"Error uploading {file_path}: {e}")
                 self._stats["errors"] += 1
-                return False, 0.0
+                return False, {}
+
+    def _is_large_upload(self, file_path: Path, scanned_entry: Optional[Dict[str, Any]] = None) -> bool:
+        """Return True if the file will go through S3 multipart upload.
+
+        Args:
+            file_path: Local file path
+            scanned_entry: Optional scan-time entry whose size avoids an extra stat
+
+        Returns:
+            True when the file is larger than MULTIPART_THRESHOLD
+        """
+        return self._upload_size(file_path, scanned_entry) > MULTIPART_THRESHOLD
+
+    def _upload_size(self, file_path: Path, scanned_entry: Optional[Dict[str, Any]] = None) -> int:
+        """Return the size used to classify and time an upload.
+
+        Args:
+            file_path: Local file path
+            scanned_entry: Optional scan-time entry whose size avoids an extra stat
+
+        Returns:
+            File size in bytes, -1 if the file cannot be stat'ed
+        """
+        if isinstance(scanned_entry, dict) and scanned_entry.get("size", -1) >= 0:
+            return scanned_entry["size"]
+        return self._stat_fingerprint(file_path)["size"]
+
+    @staticmethod
+    def _upload_timeout(size: int) -> float:
+        """Return the wall-clock limit for uploading a file of the given size.
+
+        Args:
+            size: File size in bytes
 
-    async def _upload_with_timeout(self, filename: str, folder_path: Path) -> Tuple[str, bool, float]:
-        """Wrap a single upload in asyncio.wait_for so the 300s window belongs to the coroutine, not the task.
+        Returns:
+            UPLOAD_TIMEOUT_SECONDS for single-PUT uploads; for multipart uploads the time
+            to send the file at LARGE_UPLOAD_MIN_BYTES_PER_SECOND, but never less
+        """
+        if size <= MULTIPART_THRESHOLD:
+            return UPLOAD_TIMEOUT_SECONDS
+        return max(UPLOAD_TIMEOUT_SECONDS, size / LARGE_UPLOAD_MIN_BYTES_PER_SECOND)
+
+    async def _upload_with_timeout(
+        self,
+        filename: str,
+        folder_path: Path,
+        scanned_entry: Optional[Dict[str, Any]] = None,
+        prechecked: bool = False,
+        size: Optional[int] = None,
+    ) -> Tuple[str, bool, Dict[str, Any]]:
+        """Wrap a single upload in asyncio.wait_for so the timeout window belongs to the coroutine, not the task.
 
         ASYNC-02 Pitfall 1 fix: when wait_for was applied to an already-created task
         inside a serial for-loop, the N-th file's timeout window began only after the
         (N-1)-th completed or timed out. Wrapping the coroutine BEFORE create_task ensures
-        each file gets its own independent 300s window running concurrently.
+        each file gets its own independent window running concurrently.
+
+        Single-PUT uploads get UPLOAD_TIMEOUT_SECONDS. Multipart (large) uploads get a
+        deadline proportional to their size (see _upload_timeout): a multi-GB file on a
+        slow link can legitimately take longer than 300s, but a stalled one must still
+        give up its large-upload slot eventually.
 
         Args:
             filename: Name of file to upload
             folder_path: Folder containing the file
+            scanned_entry: Optional scan-time {md5, size, mtime_ns} entry (see _upload_single_file)
+            prechecked: Whether scanned_entry's MD5 was already checked against S3
+            size: File size if the caller already knows it; None looks it up here
 
         Returns:
-            Tuple (filename, success_bool, upload_mtime). upload_mtime is the st_mtime
-            captured just before upload (D-02). On failure, upload_mtime is 0.0.
+            Tuple (filename, success_bool, entry). entry is the {md5, size, mtime_ns} dict
+            recorded for the upload (D-02). On failure, entry is {}.
         """
+        # Size the file once here and hand the class down, so it is stat'ed at most once
+        if size is None:
+            size = self._upload_size(folder_path / filename, scanned_entry)
+        large = size > MULTIPART_THRESHOLD
+        timeout = self._upload_timeout(size)
         try:
-            ok, upload_mtime = await asyncio.wait_for(self._upload_single_file(filename, folder_path), timeout=300)
-            return filename, bool(ok), upload_mtime
+            ok, entry = await asyncio.wait_for(
+                self._upload_single_file(filename, folder_path, scanned_entry, prechecked, large), timeout=timeout
+            )
+            return filename, bool(ok), entry
         except asyncio.TimeoutError:
-            logger.error(f"Upload timeout for {filename} (5 minutes)")
+            logger.error(f"Upload timeout for {filename} (after {timeout:g}s)")
             self._stats["errors"] += 1
-            return filename, False, 0.0
+            return filename, False, {}
         except Exception as e:
             logger.error(f"Upload task failed for {filename}: {e}")
             self._stats["errors"] += 1
-            return filename, False, 0.0
+            return filename, False, {}
 
-    async def _upload_files(self, files_to_upload: List[str], folder_path: Path) -> Dict[str, float]:
-        """Upload files to S3 concurrently using asyncio.gather.
+    async def _upload_files(
+        self,
+        files_to_upload: List[str],
+        folder_path: Path,
+        scanned_files: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Upload files to S3 concurrently through a bounded worker pipeline.
 
-        ASYNC-02 fix: replaces serial-wait_for-in-for-loop with a single gather call so all
-        N uploads race their 300s timeouts concurrently. ASYNC-06 hook: each task is also
-        added to self._active_upload_tasks so the shutdown drain can await in-flight work.
+        ASYNC-02 fix: uploads run concurrently rather than serially. Small uploads each race
+        their own 300s timeout; multipart-sized ones get a size-proportional deadline.
+        Filenames are split by size class and fed through one bounded queue per class to
+        a fixed set of workers sized to that class's limit, so large uploads cannot starve
+        small ones and memory stays O(workers) rather than O(files). ASYNC-06 hook: each in-flight upload
+        task is added to self._active_upload_tasks so the shutdown drain can await it.
 
         Args:
             files_to_upload: List of filenames to upload
             folder_path: Folder containing the files
+            scanned_files: Optional {filename: entry} mapping from _scan_current_files whose
+                MD5s are reused for files unchanged since the scan
 
         Returns:
-            Dict mapping successfully-uploaded filename to the upload_mtime captured just
-            before the upload call (D-02). Failed uploads are absent from the dict.
+            Dict mapping successfully-uploaded filename to its {md5, size, mtime_ns} entry,
+            with size/mtime_ns captured before the upload call (D-02). Failed uploads are
+            absent from the dict.
         """
         if not files_to_upload:
             return {}
+        if scanned_files is None:
+            scanned_files = {}
 
-        logger.info(
-            f"Starting concurrent upload of {len(files_to_upload)} files "
-            f"(max {self.config.max_concurrent_uploads} parallel)"
-        )
+        uploaded_files: Dict[str, Dict[str, Any]] = {}
 
-        tasks: List[asyncio.Task] = []
+        # Bulk existence check: HEAD every file with a scan-time MD5 in parallel (own
+        # concurrency limit), record matches as done and only launch uploads for deltas.
+        prechecked_keys: Dict[str, str] = {}
         for filename in files_to_upload:
-            task = asyncio.create_task(
-                self._upload_with_timeout(filename, folder_path),
-                name=f"upload-{folder_path.name}-{filename}",
+            entry = scanned_files.get(filename)
+            if isinstance(entry, dict) and entry.get("md5"):
+                prechecked_keys[filename] = self._build_s3_key(folder_path / filename)
+        if prechecked_keys:
+            exists = await self.s3_manager.check_exists_many(
+                {key: scanned_files[name]["md5"] for name, key in prechecked_keys.items()}
             )
-            self._active_upload_tasks.add(task)
-            task.add_done_callback(self._active_upload_tasks.discard)
-            tasks.append(task)
-
-        # Gather all upload coroutines concurrently; return_exceptions=True prevents one
-        # failure from cancelling the rest. Done callbacks tick the progress bar.
-        pbar = sync_tqdm(total=len(tasks), desc=f"Uploading {folder_path.name}", unit="file", leave=True)
-        for task in tasks:
-            task.add_done_callback(lambda _f: pbar.update())
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        pbar.close()
-
-        uploaded_files: Dict[str, float] = {}
+            for filename, key in prechecked_keys.items():
+                if exists.get(key) is True:
+                    logger.info(f"File already exists in S3 with same MD5: {key}")
+                    self._stats["skipped_files"] += 1
+                    uploaded_files[filename] = scanned_files[filename]
+            pending = [f for f in files_to_upload if f not in uploaded_files]
+        else:
+            pending = list(files_to_upload)
+        if not pending:
+            return uploaded_files
+
+        logger.info(
+            f"Starting concurrent upload of {len(pending)} files (max {self.config.max_concurrent_uploads} parallel)"
+        )
+
+        # Classify each file by size class before enqueueing so small and large uploads run
+        # in separate lanes: a run of multipart-sized files cannot occupy the workers that
+        # small files need, and vice versa.
+        sizes: Dict[str, int] = {}
+        small_files: List[str] = []
+        large_files: List[str] = []
+        for filename in pending:
+            sizes[filename] = self._upload_size(folder_path / filename, scanned_files.get(filename))
+            if sizes[filename] > MULTIPART_THRESHOLD:
+                large_files.append(filename)
+            else:
+                small_files.append(filename)
+
+        results: List[Any] = []
+        in_flight: Set[asyncio.Task] = set()
+        pbar = sync_tqdm(total=len(pending), desc=f"Uploading {folder_path.name}", unit="file", leave=True)
+
+        async def worker(queue: asyncio.Queue) -> None:
+            while True:
+                filename = await queue.get()
+                if filename is None:
+                    return
+                # Each upload still runs as its own named task so the shutdown drain can
+                # await it and name it if abandoned (D-04).
+                task = asyncio.create_task(
+                    self._upload_with_timeout(
+                        filename, folder_path, scanned_files.get(filename), filename in prechecked_keys, sizes[filename]
+                    ),
+                    name=f"upload-{folder_path.name}-{filename}",
+                )
+                self._active_upload_tasks.add(task)
+                task.add_done_callback(self._active_upload_tasks.discard)
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+                # asyncio.wait (unlike awaiting the task) keeps the two cancellations apart:
+                # a CancelledError here always means the worker itself is being cancelled,
+                # while a drain-cancelled upload simply comes back done and cancelled.
+                try:
+                    await asyncio.wait({task})
+                except asyncio.CancelledError:
+                    task.cancel()
+                    raise
+                if task.cancelled():
+                    # Upload abandoned by the shutdown drain: record it as failed and move on
+                    results.append((filename, False, {}))
+                elif task.exception() is not None:
+                    results.append(task.exception())
+                else:
+                    results.append(task.result())
+                pbar.update()
+
+        async def feed(queue: asyncio.Queue, filenames: List[str], worker_count: int) -> None:
+            for filename in filenames:
+                await queue.put(filename)
+            for _ in range(worker_count):
+                await queue.put(None)
+
+        # Bounded producer/consumer pipeline per size class: each lane has its own queue and
+        # as many workers as its semaphore allows, so only that many upload tasks are alive
+        # at once instead of one Task per pending file.
+        lanes = (
+            (small_files, self.config.max_concurrent_uploads),
+            (large_files, self.config.max_concurrent_large_uploads),
+        )
+        workers: List[asyncio.Task] = []
+        feeders: List[asyncio.Task] = []
+        for filenames, limit in lanes:
+            if not filenames:
+                continue
+            worker_count = min(len(filenames), limit)
+            queue: asyncio.Queue = asyncio.Queue(maxsize=worker_count * 2)
+            workers.extend(asyncio.create_task(worker(queue)) for _ in range(worker_count))
+            feeders.append(asyncio.create_task(feed(queue, filenames, worker_count)))
+        try:
+            # Workers never raise (upload errors are collected into results), so one
+            # failing file cannot cancel the rest.
+            await asyncio.gather(*feeders, *workers)
+        finally:
+            for t in feeders + workers:
+                if not t.done():
+                    t.cancel()
+            pbar.close()
+            # On cancellation, wait for the workers and the uploads they cancelled so no
+            # task outlives this call
+            leftover = [t for t in feeders + workers + list(in_flight) if not t.done()]
+            if leftover:
+                await asyncio.wait(leftover)
+
         for result in results:
             if isinstance(result, Exception):
                 logger.error(f"Upload coroutine raised unexpectedly: {result}")
                 self._stats["errors"] += 1
                 continue
-            filename, ok, upload_mtime = result
+            filename, ok, entry = result
             if ok:
-                uploaded_files[filename] = upload_mtime
+                uploaded_files[filename] = entry
                 logger.debug(f"Successfully uploaded: {filename}")
             else:
                 logger.warning(f"Upload failed for: {filename}")
@@ -597,17 +1023,13 @@ class FileListener:
         Returns:
             S3 key string
         """
-        # Find which watch folder this file belongs to
-        for watch_folder in self.config.watch_folders:
-            try:
-                # Get relative path from watch folder
-                relative_path = file_path.relative_to(watch_folder)
-                # Use custom S3 name from mapping instead of folder name
-                s3_folder_name = self.config.get_s3_name_for_folder(watch_folder)
-                s3_key = f"{s3_folder_name}/{relative_path}"
-                return s3_key.replace("\\", "/")  # Ensure forward slashes
-            except ValueError:
-                continue  # File not under this watch folder
+        # Find which watch folder this file belongs to (precomputed prefixes, no relative_to)
+        match = self._match_watch_root(file_path)
+        if match is not None:
+            _, s3_folder_name, relative_path = match
+            # Use custom S3 name from mapping instead of folder name
+            s3_key = f"{s3_folder_name}/{relative_path}"
+            return s3_key.replace("\\", "/")  # Ensure forward slashes
 
         # Fallback: use absolute path (shouldn't happen normally)
         return str(file_path).replace("\\", "/")
@@ -617,21 +1039,36 @@ class FileListener:
 
         ASYNC-03: async write via aiofiles; asyncio.Lock prevents a simultaneous read
         from seeing a half-written file.
+        The content is written to a sibling temp file, fsync'ed and swapped in with
+        os.replace, so a crash mid-write leaves the previous manifest intact instead of
+        a truncated one (which would force a full re-hash of the folder).
         PERF-02: Updates in-memory cache after write and invalidates cached disk-mtime so
         the next _load_backup_info re-stats and picks up the new disk timestamp.
 
         Args:
             backup_info_file: Path to backup info file
-            backup_files: Files and their {md5, mtime} dicts to record as backed up
+            backup_files: Files and their {md5, size, mtime_ns} dicts to record as backed up
 
         Returns:
             True if the write succeeded, False otherwise.
         """
-        backup_info = {"timestamp": datetime.now().isoformat(), "files": backup_files}
+        backup_info = {
+            "version": BACKUP_INFO_VERSION,
+            "timestamp": datetime.now().isoformat(),
+            "files": backup_files,
+        }
+        # Dot-prefixed, so the scanner ignores a leftover temp file after a crash
+        tmp_file = backup_info_file.with_name(backup_info_file.name + ".tmp")
         try:
+            # Serialize before taking the lock: only the file I/O needs to exclude
+            # readers. Machine-read file: compact separators, no indent pass.
+            payload = json.dumps(backup_info, separators=(",", ":"))
             async with self._get_folder_lock(backup_info_file.parent):
-                async with aiofiles.open(backup_info_file, "w", encoding="utf-8") as f:
-                    await f.write(json.dumps(backup_info, indent=2))
+                async with aiofiles.open(tmp_file, "w", encoding="utf-8") as f:
+                    await f.write(payload)
+                    await f.flush()
+                    await asyncio.to_thread(os.fsync, f.fileno())
+                os.replace(tmp_file, backup_info_file)
                 # PERF-02: update cache with new content; invalidate cached disk mtime so the
                 # next _load_backup_info re-stats and picks up the OS-assigned mtime after write.
                 self._backup_info_cache[backup_info_file.parent] = backup_files
@@ -639,6 +1076,10 @@ class FileListener:
             return True
         except Exception as e:
             logger.error(f"Failed to update backup info {backup_info_file}: {e}")
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
             return False
 
     async def _calculate_md5_with_semaphore(self, file_path: Path) -> Optional[str]:
@@ -654,7 +1095,7 @@ class FileListener:
             return await self._calculate_md5(file_path)
 
     def _calculate_md5_sync(self, file_path: Path) -> Optional[str]:
-        """Synchronous MD5 computation for use inside asyncio.to_thread.
+        """Synchronous MD5 computation for use inside the shared hash pool.
 
         Args:
             file_path: Path to file
@@ -663,21 +1104,17 @@ class FileListener:
             MD5 hash as hex string, or None if error
         """
         try:
-            hasher = hashlib.md5()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(1048576), b""):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
+            return md5_file(file_path)
         except Exception as e:
             logger.error(f"Error calculating MD5 for {file_path}: {e}")
             return None
 
     async def _calculate_md5(self, file_path: Path) -> Optional[str]:
-        """Calculate MD5 hash of a file by offloading to a thread pool.
+        """Calculate MD5 hash of a file by offloading to the shared hash pool.
 
         hashlib releases the GIL during C-level hashing, so multiple threads
-        can genuinely parallelize. 1MB chunks minimise per-chunk overhead vs
-        the old 8192-byte aiofiles loop.
+        can genuinely parallelize. The pool is sized to CPU count and shared
+        with S3Manager so hashing never oversubscribes the machine.
 
         Args:
             file_path: Path to file
@@ -685,7 +1122,7 @@ class FileListener:
         Returns:
             MD5 hash as hex string, or None if error
         """
-        return await asyncio.to_thread(self._calculate_md5_sync, file_path)
+        return await run_in_hash_pool(self._calculate_md5_sync, file_path)
 
     def get_statistics(self) -> dict:
         """Get current statistics.
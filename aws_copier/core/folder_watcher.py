@@ -1,12 +1,15 @@
 """Folder watcher for real-time file changes."""
 
 import asyncio
+import inspect
 import logging
+import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 
-from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.events import FileCreatedEvent, FileModifiedEvent, FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 
 from aws_copier.core.file_listener import FileListener
 from aws_copier.core.ignore_rules import IGNORE_RULES
@@ -44,6 +47,14 @@ class FileChangeHandler(FileSystemEventHandler):
         # additional locking is needed. The 2-second window and per-path keying are
         # locked by D-06.
         self._debounce_tasks: Dict[str, asyncio.Task] = {}
+        # Normcased "watch_folder/" prefix for name-only checks on event paths
+        root = os.path.normcase(str(watch_folder))
+        self._root_prefix = root if root.endswith(os.sep) else root + os.sep
+        # Per-folder coalescing of debounced events (loop thread only): at most one
+        # _process_current_folder run per folder at a time; events arriving during a run
+        # mark the folder dirty so it is rescanned once more, not once per file.
+        self._folder_runs: Dict[str, asyncio.Task] = {}
+        self._dirty_folders: Set[str] = set()
 
     def on_any_event(self, event: FileSystemEvent) -> None:
         """Handle any file system event."""
@@ -56,16 +67,24 @@ class FileChangeHandler(FileSystemEventHandler):
             if event.event_type not in ["created", "modified"]:
                 return
 
-            file_path = Path(event.src_path)
+            src_path = os.fsdecode(event.src_path)
 
-            # Skip if file should be ignored (IGNORE-03: delegate to canonical IGNORE_RULES singleton)
-            if IGNORE_RULES.should_ignore_file(file_path):
+            # Skip if file should be ignored (IGNORE-03: delegate to canonical IGNORE_RULES
+            # singleton). Name-only check on the event string: ignored events build no Path.
+            if IGNORE_RULES.should_ignore_file_name(os.path.basename(src_path)):
+                return
+
+            # Skip files inside ignored directories (.git, node_modules, ...): the scanner
+            # prunes these, so their event churn must not trigger folder scans either
+            if self._in_ignored_dir(src_path):
                 return
 
             # Skip if file doesn't exist (might have been deleted quickly)
-            if not file_path.exists():
+            if not os.path.exists(src_path):
                 return
 
+            file_path = Path(src_path)
+
             # Schedule async processing via run_coroutine_threadsafe (ASYNC-01).
             # PERF-04: route through _schedule_debounced so a 2-second per-path window
             # collapses rapid events (atomic-save patterns) into one _process_changed_file call.
@@ -79,6 +98,26 @@ class FileChangeHandler(FileSystemEventHandler):
         except Exception as e:
             logger.error(f"Error handling file system event: {e}")
 
+    def _in_ignored_dir(self, src_path: str) -> bool:
+        """Return True if any folder between the watch root and src_path is ignored.
+
+        Pure string work on the event path (name-only IGNORE_RULES.should_ignore_dir_name
+        per component); no Path objects or stat calls.
+
+        Args:
+            src_path: Absolute path from the watchdog event
+
+        Returns:
+            True when a parent directory name below the watch root is ignored
+        """
+        key = os.path.normcase(src_path)
+        if not key.startswith(self._root_prefix):
+            return False
+        relative = src_path[len(self._root_prefix) :]
+        if os.altsep:
+            relative = relative.replace(os.altsep, os.sep)
+        return any(IGNORE_RULES.should_ignore_dir_name(part) for part in relative.split(os.sep)[:-1])
+
     async def _schedule_debounced(self, file_path: Path, event_type: str) -> None:
         """Schedule a debounced _process_changed_file call for file_path.
 
@@ -126,10 +165,12 @@ class FileChangeHandler(FileSystemEventHandler):
         Returns:
             None
         """
-        for task in list(self._debounce_tasks.values()):
+        for task in list(self._debounce_tasks.values()) + list(self._folder_runs.values()):
             if not task.done():
                 task.cancel()
         self._debounce_tasks.clear()
+        self._folder_runs.clear()
+        self._dirty_folders.clear()
 
     async def _process_changed_file(self, file_path: Path, event_type: str) -> None:
         """Process a changed file using incremental backup logic.
@@ -157,14 +198,51 @@ class FileChangeHandler(FileSystemEventHandler):
 
             logger.info(f"📁 File {event_type}: {file_path}")
 
-            # Process just this folder using incremental backup
-            await self.file_listener._process_current_folder(folder_path)
+            # Process just this folder using incremental backup, coalesced per folder
+            await self._process_folder_coalesced(folder_path)
 
             logger.debug(f"✅ Processed {event_type} file: {file_path}")
 
         except Exception as e:
             logger.error(f"Error processing changed file {file_path}: {e}")
 
+    async def _process_folder_coalesced(self, folder_path: Path) -> None:
+        """Process folder_path, merging concurrent requests for the same folder.
+
+        A burst of events (e.g. `cp -r` into one folder) fires one debounce per file. If
+        a run for the folder is already in flight, the folder is only marked dirty and the
+        in-flight run rescans it once more when done, so N events cost at most two folder
+        scans instead of N. The run is shielded so a newer event cancelling this path's
+        debounce task does not abort a scan serving other files.
+
+        Args:
+            folder_path: Folder containing the changed file
+        """
+        key = str(folder_path)
+        running = self._folder_runs.get(key)
+        if running is not None and not running.done():
+            self._dirty_folders.add(key)
+            return
+        task = asyncio.create_task(self._run_folder(folder_path), name=f"watch-folder-{folder_path.name}")
+        self._folder_runs[key] = task
+        await asyncio.shield(task)
+
+    async def _run_folder(self, folder_path: Path) -> None:
+        """Run _process_current_folder until no new events marked the folder dirty.
+
+        Args:
+            folder_path: Folder to process
+        """
+        key = str(folder_path)
+        try:
+            while True:
+                self._dirty_folders.discard(key)
+                await self.file_listener._process_current_folder(folder_path)
+                if key not in self._dirty_folders:
+                    break
+        finally:
+            self._folder_runs.pop(key, None)
+
 
 class FolderWatcher:
     """Watches folders for real-time file changes and processes them with incremental backup."""
@@ -178,7 +256,10 @@ class FolderWatcher:
         """
         self.config = config
         self.file_listener = file_listener
-        self.observer = Observer()
+        if config.watch_backend == "polling":
+            self.observer = PollingObserver(timeout=config.watch_poll_interval)
+        else:
+            self.observer = Observer()
         self.handlers: Dict[str, FileChangeHandler] = {}
         self.running = False
         self.event_loop: Optional[asyncio.AbstractEventLoop] = None
@@ -249,7 +330,7 @@ class FolderWatcher:
 
         # Add to observer
         try:
-            self.observer.schedule(handler, str(folder_path), recursive=True)
+            self._schedule_handler(handler, folder_path)
 
             folder_id = str(folder_path)
             self.handlers[folder_id] = handler
@@ -260,6 +341,27 @@ class FolderWatcher:
         except Exception as e:
             logger.error(f"Error adding watch for folder {folder_path}: {e}")
 
+    def _schedule_handler(self, handler: FileChangeHandler, folder_path: Path) -> None:
+        """Register handler with the observer, filtering event types inside watchdog.
+
+        Only file created/modified events are acted on. Passing them as event_filter
+        (watchdog >= 4) drops deletes, moves and the open/close events inotify emits
+        for every read in the emitter thread, before any Python handler dispatch.
+        Older watchdog versions without event_filter fall back to on_any_event's checks.
+        Support is detected from schedule()'s signature rather than by catching
+        TypeError, which would also hide unrelated errors raised inside watchdog.
+
+        Args:
+            handler: Event handler for folder_path
+            folder_path: Folder to watch recursively
+        """
+        if "event_filter" in inspect.signature(self.observer.schedule).parameters:
+            self.observer.schedule(
+                handler, str(folder_path), recursive=True, event_filter=[FileCreatedEvent, FileModifiedEvent]
+            )
+        else:
+            self.observer.schedule(handler, str(folder_path), recursive=True)
+
     def get_statistics(self) -> dict:
         """Get watcher statistics.
 
@@ -0,0 +1,133 @@
+"""Shared MD5 hashing helpers backed by a dedicated, bounded thread pool."""
+
+import asyncio
+import hashlib
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Optional, TypeVar
+
+# 1 MiB reads amortize syscall and per-chunk Python overhead on large files
+HASH_CHUNK_SIZE = 1 << 20
+
+# Files at least this big are read in LARGE_HASH_CHUNK_SIZE blocks to keep the disk streaming
+LARGE_FILE_LIMIT = 64 * 1024 * 1024
+LARGE_HASH_CHUNK_SIZE = 4 << 20
+
+# Below this size a single read() beats allocating a reusable 1 MiB read buffer per call
+SMALL_FILE_LIMIT = 64 * 1024
+
+HASH_POOL_WORKERS = os.cpu_count() or 4
+
+T = TypeVar("T")
+
+# Dedicated pool sized to CPU count. hashlib releases the GIL while digesting, so one
+# thread per core saturates hashing without the thread thrash (and unbounded backlog)
+# of pushing every file onto the loop's default executor. Created on first use and
+# released by shutdown_hash_pool(), so importing this module starts no threads.
+_HASH_POOL: Optional[ThreadPoolExecutor] = None
+_HASH_POOL_LOCK = threading.Lock()
+
+
+def md5_file(file_path: Path) -> str:
+    """Compute the MD5 hex digest of a file (blocking).
+
+    Args:
+        file_path: Path to file
+
+    Returns:
+        MD5 hash as hex string
+
+    Raises:
+        OSError: If the file cannot be opened or read
+    """
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < SMALL_FILE_LIMIT:
+            # One read + one update; hashlib releases the GIL for the digest itself
+            return hashlib.md5(f.read()).hexdigest()
+        _advise_sequential(f.fileno())
+        # hashlib.file_digest runs the same readinto loop but with a fixed 256 KiB buffer;
+        # sizing the buffer to the file keeps reads in the MiB range on large files
+        return _md5_readinto(f, LARGE_HASH_CHUNK_SIZE if size >= LARGE_FILE_LIMIT else HASH_CHUNK_SIZE)
+
+
+def _advise_sequential(fd: int) -> None:
+    """Hint the kernel that fd will be read front to back, doubling readahead (POSIX only).
+
+    DONTNEED is deliberately not issued after hashing: changed files are read again by
+    the upload right after, and should still be in the page cache.
+
+    Args:
+        fd: Open file descriptor
+    """
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # advisory only; e.g. unsupported on some filesystems
+
+
+def _md5_readinto(f: BinaryIO, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    """Hash an open binary file by reading into one reusable buffer.
+
+    Args:
+        f: File object opened in binary mode
+        chunk_size: Size of the reusable read buffer in bytes
+
+    Returns:
+        MD5 hash as hex string
+    """
+    hasher = hashlib.md5()
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    while True:
+        n = f.readinto(buf)
+        if not n:
+            break
+        hasher.update(view[:n])
+    return hasher.hexdigest()
+
+
+def _get_hash_pool() -> ThreadPoolExecutor:
+    """Return the shared hash pool, creating it on first use.
+
+    Returns:
+        The process-wide md5 ThreadPoolExecutor
+    """
+    global _HASH_POOL
+    with _HASH_POOL_LOCK:
+        if _HASH_POOL is None:
+            _HASH_POOL = ThreadPoolExecutor(max_workers=HASH_POOL_WORKERS, thread_name_prefix="md5")
+        return _HASH_POOL
+
+
+def shutdown_hash_pool(wait: bool = True) -> None:
+    """Shut down the shared hash pool and release its threads.
+
+    A later run_in_hash_pool call starts a fresh pool, so this is safe to call from
+    an application's shutdown path or between tests.
+
+    Args:
+        wait: Block until queued and running hashes have finished
+    """
+    global _HASH_POOL
+    with _HASH_POOL_LOCK:
+        pool, _HASH_POOL = _HASH_POOL, None
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+async def run_in_hash_pool(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking hashing callable on the shared hash pool.
+
+    Args:
+        func: Blocking callable to run
+        *args: Positional arguments for func
+
+    Returns:
+        Whatever func returns
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_pool(), func, *args)
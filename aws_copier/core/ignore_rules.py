@@ -2,9 +2,11 @@
 
 import fnmatch
 import logging
+import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import FrozenSet
+from typing import FrozenSet, Optional, Pattern, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +98,36 @@ class IgnoreRules:
     sensitive_deny: FrozenSet[str] = field(default_factory=lambda: SENSITIVE_DENY)
     ignore_dirs: FrozenSet[str] = field(default_factory=lambda: IGNORE_DIRS)
 
+    # Derived lookup tables built once in __post_init__ (not constructor arguments)
+    _exact_names: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _suffixes: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _glob_regex: Optional[Pattern[str]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Split the patterns into exact names, '*suffix' patterns and remaining globs.
+
+        Exact names become a set lookup, '*suffix' patterns a single str.endswith call
+        and the remaining globs one alternation regex built with fnmatch.translate, so
+        the per-file check no longer loops over patterns in Python. Patterns are
+        normcased the same way fnmatch does, keeping matching case-insensitive on Windows.
+        """
+        exact = set()
+        suffixes = []
+        other = []
+        for pattern in self.sensitive_deny | self.glob_patterns:
+            pattern = os.path.normcase(pattern)
+            if not any(ch in pattern for ch in "*?["):
+                exact.add(pattern)
+            elif pattern.startswith("*") and not any(ch in pattern[1:] for ch in "*?["):
+                suffixes.append(pattern[1:])
+            else:
+                other.append(pattern)
+        # frozen dataclass: derived fields must be set via object.__setattr__
+        object.__setattr__(self, "_exact_names", frozenset(exact))
+        object.__setattr__(self, "_suffixes", tuple(sorted(suffixes)))
+        glob_regex = re.compile("|".join(fnmatch.translate(p) for p in sorted(other))) if other else None
+        object.__setattr__(self, "_glob_regex", glob_regex)
+
     def should_ignore_file(self, path: Path) -> bool:
         """Return True if the file must not be uploaded to S3.
 
@@ -106,19 +138,30 @@ class IgnoreRules:
             True when the file matches any dot-prefix rule, sensitive deny pattern,
             or glob pattern; False otherwise.
         """
-        name = path.name
+        return self.should_ignore_file_name(path.name)
+
+    def should_ignore_file_name(self, name: str) -> bool:
+        """Return True if a file with this bare name must not be uploaded to S3.
+
+        Name-only variant of `should_ignore_file` for callers iterating
+        `os.scandir` entries, so skipped files never need a Path built.
+
+        Args:
+            name: File name (no directory component)
+
+        Returns:
+            True when the name matches any dot-prefix rule, sensitive deny pattern,
+            or glob pattern; False otherwise.
+        """
         # Dot-prefix files always ignored (IGNORE-02 — includes .env, .npmrc, etc.)
         if name.startswith("."):
             return True
-        # Sensitive file deny list (IGNORE-02)
-        for pattern in self.sensitive_deny:
-            if fnmatch.fnmatch(name, pattern):
-                return True
-        # Standard glob patterns (IGNORE-01)
-        for pattern in self.glob_patterns:
-            if fnmatch.fnmatch(name, pattern):
-                return True
-        return False
+        # Sensitive deny list (IGNORE-02) and standard glob patterns (IGNORE-01),
+        # pre-split into exact names and suffixes in __post_init__
+        name = os.path.normcase(name)
+        if name in self._exact_names or name.endswith(self._suffixes):
+            return True
+        return self._glob_regex is not None and self._glob_regex.match(name) is not None
 
     def should_ignore_dir(self, path: Path) -> bool:
         """Return True if the directory should be skipped entirely during scan.
@@ -130,10 +173,7 @@ class IgnoreRules:
             True when the directory matches a name in `ignore_dirs`, starts with
             a dot, or is a symlink; False otherwise.
         """
-        name = path.name
-        if name in self.ignore_dirs:
-            return True
-        if name.startswith("."):
+        if self.should_ignore_dir_name(path.name):
             return True
         try:
             if path.is_symlink():
@@ -143,6 +183,20 @@ class IgnoreRules:
             return True
         return False
 
+    def should_ignore_dir_name(self, name: str) -> bool:
+        """Return True if a directory with this bare name should be skipped.
+
+        Name-only check (no symlink test) for callers that already know the entry
+        is a real directory, e.g. `DirEntry.is_dir(follow_symlinks=False)`.
+
+        Args:
+            name: Directory name (no parent component)
+
+        Returns:
+            True when the name is in `ignore_dirs` or starts with a dot; False otherwise.
+        """
+        return name in self.ignore_dirs or name.startswith(".")
+
 
 # Module-level singleton — import this, do not instantiate IgnoreRules directly.
 IGNORE_RULES: IgnoreRules = IgnoreRules()
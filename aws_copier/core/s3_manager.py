@@ -3,52 +3,132 @@
 import asyncio
 import base64
 import contextlib
-import hashlib
 import logging
 from pathlib import Path
 import os
-from typing import Any, Optional, Dict
+import time
+from typing import Any, Optional, Dict, List, Tuple
 
 from aiobotocore.session import get_session
 from aiobotocore.config import AioConfig
 from botocore.exceptions import ClientError
 
+from aws_copier.core.hashing import md5_file, run_in_hash_pool
 from aws_copier.models.simple_config import SimpleConfig
 
 logger = logging.getLogger(__name__)
 
+# Files larger than this are uploaded with multipart upload instead of a single PUT
+MULTIPART_THRESHOLD = 100 * 1024 * 1024  # 100MB
+
+# Parts of one multipart upload in flight at once (sliding window)
+MULTIPART_CONCURRENCY = 4
+
+# Default multipart part size; grows for very large files so the part count stays
+# under MULTIPART_MAX_PARTS (S3 hard limit is 10,000 — keep some headroom)
+MULTIPART_PART_SIZE = 16 * 1024 * 1024  # 16MB
+MULTIPART_MAX_PARTS = 9500
+
+# Floor for the automatically sized HTTP connection pool
+MIN_POOL_CONNECTIONS = 100
+
+# In-flight HEAD requests per check_exists_many batch
+CHECK_EXISTS_CONCURRENCY = 64
+
+# How long a build_index() listing is trusted by check_exists before HEADs take over again
+KEY_INDEX_TTL_SECONDS = 300
+
+# check_exists_many lists a folder once instead of HEADing each key from this many keys up
+KEY_INDEX_MIN_KEYS = 20
+
+# ...but abandons that listing once it passes this many objects per key being checked,
+# so a handful of local files never pages through a huge remote folder (one 1000-object
+# LIST page costs about as much as 20 HEADs)
+KEY_INDEX_MAX_OBJECTS_PER_KEY = 50
+
+
+def multipart_part_size(file_size: int) -> int:
+    """Pick the multipart part size for a file.
+
+    Args:
+        file_size: File size in bytes
+
+    Returns:
+        Part size in bytes: at least MULTIPART_PART_SIZE, rounded up to a whole MiB,
+        and large enough that the file fits in MULTIPART_MAX_PARTS parts
+    """
+    mib = 1024 * 1024
+    needed = -(-file_size // MULTIPART_MAX_PARTS)  # ceil division
+    needed = -(-needed // mib) * mib
+    return max(MULTIPART_PART_SIZE, needed)
+
 
 class S3Manager:
     """Truly async S3 manager with upload and existence checking (following production pattern)."""
 
-    def __init__(self, config: SimpleConfig, max_pool_connections: int = 100):
-        """Initialize S3 manager with configuration."""
+    def __init__(self, config: SimpleConfig, max_pool_connections: Optional[int] = None):
+        """Initialize S3 manager with configuration.
+
+        Args:
+            config: Application configuration
+            max_pool_connections: HTTP pool size; None uses config.max_pool_connections,
+                or sizes the pool from the upload limits when that is 0
+        """
         self.config = config
+        if max_pool_connections is None:
+            max_pool_connections = config.max_pool_connections or self._auto_pool_size(config)
         self._exit_stack = contextlib.AsyncExitStack()
         self._session = get_session()
         self._s3_client = None
-        self._client_config = AioConfig(max_pool_connections=max_pool_connections)
+        # One persistent client (see _get_or_create_client) shares this pool across all
+        # uploads and HEADs. Keepalive stops idle pooled connections being dropped by NATs
+        # between bursts, so small files rarely pay for a fresh TCP + TLS handshake.
+        # Adaptive retries back off client-side on S3 503 SlowDown instead of hammering.
+        self._client_config = AioConfig(
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=True,
+            retries={"max_attempts": 10, "mode": "adaptive"},
+            connect_timeout=10,
+            read_timeout=120,
+        )
+        # Listing cache filled by build_index(), one entry per listed prefix:
+        # full-key prefix -> (time.monotonic() expiry, whether it covered nested keys,
+        # {full key: {"size", "etag"}, or None once we have overwritten the key and its
+        # listed ETag is no longer meaningful})
+        self._key_index: Dict[str, Tuple[float, bool, Dict[str, Optional[Dict[str, Any]]]]] = {}
+
+    @staticmethod
+    def _auto_pool_size(config: SimpleConfig) -> int:
+        """Size the connection pool so every concurrent upload request gets a connection.
+
+        Args:
+            config: Application configuration
+
+        Returns:
+            Pool size: small-file uploads plus every in-flight multipart part plus one
+            check_exists_many batch of HEADs (another folder's bulk check can overlap
+            uploads), at least MIN_POOL_CONNECTIONS
+        """
+        needed = (
+            config.max_concurrent_uploads
+            + config.max_concurrent_large_uploads * MULTIPART_CONCURRENCY
+            + CHECK_EXISTS_CONCURRENCY
+        )
+        return max(MIN_POOL_CONNECTIONS, needed)
 
     async def initialize(self) -> None:
         """Initialize async S3 client using production pattern.
 
+        The connection test runs on the persistent client that all later calls reuse,
+        so its connection (DNS + TLS) is already warm in the pool for the first upload.
+
         CONFIG-05: When config.use_credential_chain is True, explicit credentials are
         omitted from create_client kwargs so aiobotocore traverses the standard
         botocore provider chain (env vars → ~/.aws/credentials → IAM instance profile).
         """
         try:
-            # Test connection first with temporary client
-            client_kwargs: Dict[str, Any] = {
-                "region_name": self.config.aws_region,
-                "config": self._client_config,
-            }
-            if not self.config.use_credential_chain:
-                client_kwargs["aws_access_key_id"] = self.config.aws_access_key_id
-                client_kwargs["aws_secret_access_key"] = self.config.aws_secret_access_key
-            # else: aiobotocore traverses env vars → ~/.aws/credentials → IAM instance profile
-
-            async with self._session.create_client("s3", **client_kwargs) as test_client:
-                await test_client.head_bucket(Bucket=self.config.s3_bucket)
+            client = await self._get_or_create_client()
+            await client.head_bucket(Bucket=self.config.s3_bucket)
 
             logger.info(f"S3Manager initialized for bucket: {self.config.s3_bucket}")
 
@@ -171,10 +251,12 @@ class S3Manager:
         return self._s3_client
 
     async def close(self) -> None:
-        """Close the S3 manager and cleanup resources using production pattern."""
-        if self._s3_client:
-            await self._s3_client.close()
-            self._s3_client = None
+        """Close the S3 manager and cleanup resources using production pattern.
+
+        The client was entered on the exit stack, so aclose() exits it exactly once;
+        closing the client directly as well would run its cleanup twice.
+        """
+        self._s3_client = None
         if self._exit_stack:
             await self._exit_stack.aclose()
             self._exit_stack = None
@@ -199,7 +281,10 @@ class S3Manager:
             True if upload successful, False otherwise
         """
         try:
-            if not local_path.exists():
+            # One stat serves the existence check, the multipart branch and the metadata
+            try:
+                file_size = local_path.stat().st_size
+            except FileNotFoundError:
                 logger.error(f"File not found: {local_path}")
                 return False
 
@@ -212,38 +297,40 @@ class S3Manager:
             # Build full S3 key with prefix
             full_s3_key = self._build_s3_key(s3_key)
 
-            # Use chunked reading for memory efficiency (especially on Windows)
-            file_size = local_path.stat().st_size
-
             # For large files (>100MB), use multipart upload
-            if file_size > 100 * 1024 * 1024:  # 100MB
-                return await self._upload_large_file(local_path, full_s3_key, md5_hash)
+            if file_size > MULTIPART_THRESHOLD:
+                uploaded = await self._upload_large_file(local_path, full_s3_key, md5_hash, file_size)
+                if uploaded:
+                    # Multipart ETags are not an MD5; leave verification to HEAD
+                    self._index_record(full_s3_key, None)
+                return uploaded
 
             # For smaller files, use regular upload with chunked reading
             client = await self._get_or_create_client()
 
             # Prepare safe metadata
-            metadata = self._prepare_metadata(local_path, md5_hash)
+            metadata = self._prepare_metadata(local_path, md5_hash, file_size)
 
             # Use file object directly instead of reading all into memory
             with open(local_path, "rb") as f:
-                # Add timeout to prevent hanging uploads
+                # Add timeout to prevent hanging uploads. ContentMD5 makes S3 reject the PUT
+                # if the received body does not match, so a successful response is verified
+                # and no follow-up HEAD is needed.
                 await asyncio.wait_for(
                     client.put_object(
                         Bucket=self.config.s3_bucket,
                         Key=full_s3_key,
                         Body=f,
                         Metadata=metadata,
+                        ContentMD5=base64.b64encode(bytes.fromhex(md5_hash)).decode("ascii"),
                     ),
                     timeout=300,
                 )
 
-            # Verify upload by checking MD5
-            if await self.check_exists(s3_key, md5_hash):
-                logger.debug(f"Upload successful: {local_path} -> s3://{self.config.s3_bucket}/{full_s3_key}")
-                return True
-            logger.error(f"Upload verification failed for: {local_path}")
-            return False
+            # ContentMD5 was accepted, so for a plain PUT the new ETag is the MD5
+            self._index_record(full_s3_key, {"size": file_size, "etag": md5_hash})
+            logger.debug(f"Upload successful: {local_path} -> s3://{self.config.s3_bucket}/{full_s3_key}")
+            return True
 
         except Exception as e:
             logger.error(f"Upload failed for {local_path}: {e}")
@@ -262,6 +349,11 @@ class S3Manager:
         try:
             full_s3_key = self._build_s3_key(s3_key)
 
+            # Answer from a fresh build_index() listing when it is conclusive
+            indexed = self._index_lookup(full_s3_key, expected_md5)
+            if indexed is not None:
+                return indexed
+
             # Use aiobotocore for truly async operation
             client = await self._get_or_create_client()
 
@@ -275,15 +367,20 @@ class S3Manager:
             if expected_md5 is None:
                 return True
 
+            # Simple upload: the ETag is the MD5, so a match needs no metadata lookup.
+            # A mismatch still defers to the metadata, since SSE-KMS ETags are not MD5s.
+            etag = response.get("ETag", "").strip('"')
+            if "-" not in etag and etag == expected_md5:
+                return True
+
             # Check MD5 in metadata
             metadata = response.get("Metadata", {})
             stored_md5 = metadata.get("md5-checksum")
 
             if stored_md5:
                 return stored_md5 == expected_md5
-            etag = response.get("ETag", "").strip('"')
             if "-" not in etag:  # Simple upload, ETag is MD5
-                return etag == expected_md5
+                return False
             logger.warning(f"Cannot verify MD5 for multipart upload: {s3_key}")
             return True  # Assume it's correct
 
@@ -296,6 +393,193 @@ class S3Manager:
             logger.error(f"Unexpected error checking S3 object: {e}")
             return False
 
+    async def build_index(
+        self, prefix: str = "", recursive: bool = True, max_objects: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """List every object under a prefix and cache its size and ETag.
+
+        One list_objects_v2 page covers up to 1000 keys, so an incremental sync of a
+        large tree costs ceil(N/1000) LIST calls instead of N HEADs. While the listing
+        is younger than KEY_INDEX_TTL_SECONDS, check_exists answers "missing" and
+        "simple-upload ETag matches" from it and only HEADs the inconclusive keys.
+
+        Args:
+            prefix: Relative S3 folder prefix ending in "/", or "" for the whole
+                s3_prefix (s3_prefix is applied)
+            recursive: False lists only the objects directly under prefix ("/" delimiter),
+                so indexing one folder does not pull in its whole subtree
+            max_objects: Stop paginating and give up once more objects than this are
+                listed; None lists everything
+
+        Returns:
+            Mapping of full S3 key to {"size", "etag"} for the listed objects,
+            empty on error or when max_objects is exceeded (the index is left untouched)
+        """
+        full_prefix = self._build_s3_key(prefix)
+        listed: Dict[str, Dict[str, Any]] = {}
+        try:
+            client = await self._get_or_create_client()
+            started = time.monotonic()
+            kwargs: Dict[str, Any] = {"Bucket": self.config.s3_bucket, "Prefix": full_prefix}
+            if not recursive:
+                kwargs["Delimiter"] = "/"
+            while True:
+                page = await asyncio.wait_for(client.list_objects_v2(**kwargs), timeout=60)
+                for obj in page.get("Contents", []):
+                    listed[obj["Key"]] = {"size": obj.get("Size", 0), "etag": obj.get("ETag", "").strip('"')}
+                if not page.get("IsTruncated"):
+                    break
+                if max_objects is not None and len(listed) > max_objects:
+                    logger.debug(
+                        f"Abandoned listing s3://{self.config.s3_bucket}/{full_prefix} "
+                        f"after {len(listed)} objects (limit {max_objects})"
+                    )
+                    return {}
+                kwargs["ContinuationToken"] = page["NextContinuationToken"]
+        except Exception as e:
+            logger.error(f"Error listing s3://{self.config.s3_bucket}/{full_prefix}: {e}")
+            return {}
+
+        # A relisting replaces the prefix's entry wholesale; expired listings of other
+        # prefixes are dropped here so the cache cannot grow unbounded
+        self._evict_expired_index()
+        self._key_index[full_prefix] = (started + KEY_INDEX_TTL_SECONDS, recursive, dict(listed))
+        logger.debug(f"Indexed {len(listed)} objects under s3://{self.config.s3_bucket}/{full_prefix}")
+        return listed
+
+    def _index_lookup(self, full_s3_key: str, expected_md5: Optional[str]) -> Optional[bool]:
+        """Answer check_exists from the listing cache when possible.
+
+        Args:
+            full_s3_key: S3 key with prefix
+            expected_md5: Optional MD5 hash to verify against
+
+        Returns:
+            True/False when the cache is conclusive, None when a HEAD is needed
+        """
+        listings = self._index_listings(full_s3_key)
+        if not listings:
+            return None
+        if full_s3_key not in listings[0]:
+            return False
+        entry = listings[0][full_s3_key]
+        if entry is None:
+            return None
+        if expected_md5 is None:
+            return True
+        etag = entry["etag"]
+        if "-" not in etag and etag == expected_md5:
+            return True
+        # Multipart ETag or a mismatch that stored md5-checksum metadata may still explain
+        return None
+
+    def _index_listings(self, full_s3_key: str) -> List[Dict[str, Optional[Dict[str, Any]]]]:
+        """Find the fresh listings that include full_s3_key, deepest prefix first.
+
+        Only the key's own folder (any listing) and its ancestor folders (recursive
+        listings) can include it, so this costs O(key depth) dict lookups however many
+        prefixes are indexed. Expired listings met on the way are evicted.
+
+        Args:
+            full_s3_key: S3 key with prefix
+
+        Returns:
+            The {full key: entry} maps of the covering listings
+        """
+        now = time.monotonic()
+        folders = full_s3_key.split("/")[:-1]
+        listings = []
+        prefix = "/".join(folders) + "/" if folders else ""
+        for depth in range(len(folders), -1, -1):
+            listing = self._key_index.get(prefix)
+            if listing is not None:
+                expires_at, recursive, keys = listing
+                if now >= expires_at:
+                    del self._key_index[prefix]
+                elif recursive or depth == len(folders):
+                    listings.append(keys)
+            if depth:
+                prefix = prefix[: -len(folders[depth - 1]) - 1]
+        return listings
+
+    def _index_covers(self, full_s3_key: str) -> bool:
+        """Whether a listing younger than KEY_INDEX_TTL_SECONDS includes full_s3_key.
+
+        Args:
+            full_s3_key: S3 key with prefix
+
+        Returns:
+            True if check_exists may trust the index for this key
+        """
+        return bool(self._index_listings(full_s3_key))
+
+    def _evict_expired_index(self) -> None:
+        """Forget listings older than KEY_INDEX_TTL_SECONDS, each with all its keys.
+
+        Expired listings are never consulted again, so keeping them would only let the
+        cache grow with every folder check_exists_many has ever listed.
+        """
+        now = time.monotonic()
+        expired = [p for p, (expires_at, _, _) in self._key_index.items() if now >= expires_at]
+        for prefix in expired:
+            del self._key_index[prefix]
+        if expired:
+            logger.debug(f"Evicted {len(expired)} expired S3 listing(s) from the key index")
+
+    def _index_record(self, full_s3_key: str, entry: Optional[Dict[str, Any]]) -> None:
+        """Keep the listing cache in step with an upload we just made.
+
+        Only listings that include the key are updated; anything else would never be
+        consulted and could only grow the cache.
+
+        Args:
+            full_s3_key: S3 key with prefix
+            entry: {"size", "etag"} when the new ETag is known, None to force a HEAD
+        """
+        for keys in self._index_listings(full_s3_key):
+            keys[full_s3_key] = entry
+
+    async def check_exists_many(
+        self, expected_md5s: Dict[str, str], max_concurrency: int = CHECK_EXISTS_CONCURRENCY
+    ) -> Dict[str, bool]:
+        """Check many objects in parallel with HEAD requests.
+
+        HEADs are cheap and latency-bound, so they run under their own concurrency
+        limit instead of queuing behind the upload semaphore one file at a time.
+        When at least KEY_INDEX_MIN_KEYS keys share one folder that no fresh listing
+        covers, that folder is listed once first (build_index, non-recursive) so most
+        keys are answered from the listing and only inconclusive ones are HEADed. The
+        listing is abandoned past KEY_INDEX_MAX_OBJECTS_PER_KEY objects per key, in which
+        case every key is HEADed as usual.
+
+        Args:
+            expected_md5s: Mapping of S3 object key to the MD5 it must match
+            max_concurrency: Maximum number of in-flight HEAD requests
+
+        Returns:
+            Mapping of S3 object key to check_exists result (True only when the
+            object exists with a matching MD5)
+        """
+        keys = list(expected_md5s)
+        if len(keys) >= KEY_INDEX_MIN_KEYS:
+            folders = {key.rpartition("/")[0] for key in keys}
+            if len(folders) == 1 and not all(self._index_covers(self._build_s3_key(k)) for k in keys):
+                folder = folders.pop()
+                await self.build_index(
+                    f"{folder}/" if folder else "",
+                    recursive=False,
+                    max_objects=len(keys) * KEY_INDEX_MAX_OBJECTS_PER_KEY,
+                )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _check(s3_key: str, md5_hash: str) -> bool:
+            async with semaphore:
+                return await self.check_exists(s3_key, md5_hash)
+
+        results = await asyncio.gather(*(_check(k, expected_md5s[k]) for k in keys), return_exceptions=True)
+        return {key: result is True for key, result in zip(keys, results)}
+
     async def _calculate_md5(self, file_path: Path) -> Optional[str]:
         """Calculate MD5 hash of a file using async I/O.
 
@@ -306,17 +590,8 @@ class S3Manager:
             MD5 hash as hex string, or None if error
         """
         try:
-            hasher = hashlib.md5()
-
-            # Use asyncio to run in thread pool for file I/O
-            def _hash_file():
-                with open(file_path, "rb") as f:
-                    while chunk := f.read(8192):
-                        hasher.update(chunk)
-                return hasher.hexdigest()
-
-            loop = asyncio.get_running_loop()
-            return await loop.run_in_executor(None, _hash_file)
+            # Shared, CPU-sized hash pool with 1 MiB reads (see core.hashing)
+            return await run_in_hash_pool(md5_file, file_path)
 
         except Exception as e:
             logger.error(f"Error calculating MD5 for {file_path}: {e}")
@@ -372,36 +647,44 @@ class S3Manager:
                 return value
         return value
 
-    def _prepare_metadata(self, local_path: Path, md5_hash: str) -> Dict[str, str]:
+    def _prepare_metadata(self, local_path: Path, md5_hash: str, file_size: Optional[int] = None) -> Dict[str, str]:
         """Prepare metadata dictionary with safe encoding.
 
         Args:
             local_path: Local file path
             md5_hash: MD5 hash of the file
+            file_size: File size from the caller's stat; None stats the file here
 
         Returns:
             Dictionary of safely encoded metadata
         """
+        if file_size is None:
+            file_size = local_path.stat().st_size
         return {
             "md5-checksum": md5_hash,
             "original-path": self._encode_metadata_value(str(local_path)),
-            "file-size": str(local_path.stat().st_size),
+            "file-size": str(file_size),
         }
 
-    async def _upload_large_file(self, local_path: Path, s3_key: str, md5_hash: str) -> bool:
+    async def _upload_large_file(
+        self, local_path: Path, s3_key: str, md5_hash: str, file_size: Optional[int] = None
+    ) -> bool:
         """Upload large file using multipart upload for memory efficiency.
 
         Args:
             local_path: Path to local file
             s3_key: S3 key (with prefix)
             md5_hash: MD5 hash of the file
+            file_size: File size from the caller's stat; None stats the file here
 
         Returns:
             True if upload successful, False otherwise
         """
         try:
+            if file_size is None:
+                file_size = local_path.stat().st_size
             client = await self._get_or_create_client()
-            metadata = self._prepare_metadata(local_path, md5_hash)
+            metadata = self._prepare_metadata(local_path, md5_hash, file_size)
 
             # Start multipart upload
             response = await client.create_multipart_upload(
@@ -411,56 +694,62 @@ class S3Manager:
             )
             upload_id = response["UploadId"]
 
-            # Upload parts in chunks (5MB each)
-            chunk_size = 5 * 1024 * 1024  # 5MB
-            parts = []
-            part_number = 1
+            # Upload parts MULTIPART_CONCURRENCY at a time
+            completed: Dict[int, Dict[str, Any]] = {}
+            # active maps asyncio.Task -> part number
+            active: Dict["asyncio.Task[Dict[str, Any]]", int] = {}
+            part_number = 0
 
             try:
                 with open(local_path, "rb") as f:
-                    while True:
-                        chunk = f.read(chunk_size)
-                        if not chunk:
+                    chunk_size = multipart_part_size(file_size)
+                    eof = False
+                    # Sliding window: as soon as one part finishes the next chunk is read and
+                    # dispatched, so memory stays bounded to MULTIPART_CONCURRENCY x chunk_size.
+                    # Reads run in a worker thread so the disk read of the next part overlaps
+                    # the parts already uploading instead of stalling the event loop.
+                    while active or not eof:
+                        while not eof and len(active) < MULTIPART_CONCURRENCY:
+                            chunk = await asyncio.to_thread(f.read, chunk_size)
+                            if not chunk:
+                                eof = True
+                                break
+                            part_number += 1
+                            task = asyncio.create_task(
+                                self._upload_part(client, s3_key, upload_id, part_number, chunk)
+                            )
+                            active[task] = part_number
+
+                        if not active:
                             break
 
-                        # Upload part with timeout
-                        part_response = await asyncio.wait_for(
-                            client.upload_part(
-                                Bucket=self.config.s3_bucket,
-                                Key=s3_key,
-                                PartNumber=part_number,
-                                UploadId=upload_id,
-                                Body=chunk,
-                            ),
-                            timeout=300,  # 1 minute timeout per 5MB part
-                        )
-
-                        parts.append(
-                            {
-                                "ETag": part_response["ETag"],
-                                "PartNumber": part_number,
-                            }
-                        )
-
-                        part_number += 1
+                        done, _ = await asyncio.wait(active, return_when=asyncio.FIRST_COMPLETED)
+                        for task in done:
+                            pn = active.pop(task)
+                            completed[pn] = task.result()  # propagates a failed part
 
                         # Log progress for large files
-                        if part_number % 10 == 0:
-                            logger.debug(f"Uploaded {part_number - 1} parts for {local_path}")
+                        if len(completed) % 10 == 0:
+                            logger.debug(f"Uploaded {len(completed)} parts for {local_path}")
 
                 # Complete multipart upload
                 await client.complete_multipart_upload(
                     Bucket=self.config.s3_bucket,
                     Key=s3_key,
                     UploadId=upload_id,
-                    MultipartUpload={"Parts": parts},
+                    MultipartUpload={"Parts": [completed[pn] for pn in range(1, part_number + 1)]},
                 )
 
                 logger.debug(f"Large file upload successful: {local_path} -> s3://{self.config.s3_bucket}/{s3_key}")
                 return True
 
-            except Exception as e:
-                # Abort multipart upload on error
+            except BaseException as e:
+                # Cancel in-flight parts before aborting so their exceptions are not left
+                # unretrieved, then abort the multipart upload
+                for remaining in list(active):
+                    remaining.cancel()
+                if active:
+                    await asyncio.gather(*active, return_exceptions=True)
                 try:
                     await client.abort_multipart_upload(
                         Bucket=self.config.s3_bucket,
@@ -475,6 +764,33 @@ class S3Manager:
             logger.error(f"Large file upload failed for {local_path}: {e}")
             return False
 
+    async def _upload_part(
+        self, client: Any, s3_key: str, upload_id: str, part_number: int, data: bytes
+    ) -> Dict[str, Any]:
+        """Upload one multipart part.
+
+        Args:
+            client: S3 client
+            s3_key: S3 key (with prefix)
+            upload_id: Multipart upload ID
+            part_number: 1-based part number
+            data: Part body
+
+        Returns:
+            {"ETag", "PartNumber"} entry for complete_multipart_upload
+        """
+        part_response = await asyncio.wait_for(
+            client.upload_part(
+                Bucket=self.config.s3_bucket,
+                Key=s3_key,
+                PartNumber=part_number,
+                UploadId=upload_id,
+                Body=data,
+            ),
+            timeout=300,
+        )
+        return {"ETag": part_response["ETag"], "PartNumber": part_number}
+
     async def get_object_info(self, s3_key: str) -> Optional[dict]:
         """Get S3 object information using async operations.
 
@@ -52,6 +52,23 @@ class SimpleConfig:
 
         # Upload settings
         self.max_concurrent_uploads: int = kwargs.get("max_concurrent_uploads", 10)
+        # Separate, smaller limit for multipart (large) uploads so a few huge files
+        # cannot occupy every upload slot while small files wait
+        self.max_concurrent_large_uploads: int = max(1, int(kwargs.get("max_concurrent_large_uploads", 4)))
+
+        # HTTP connection pool size for the shared S3 client; 0 sizes it from the upload
+        # limits above so concurrent requests never queue for a connection
+        self.max_pool_connections: int = max(0, int(kwargs.get("max_pool_connections", 0)))
+
+        # Scan settings: number of folders processed concurrently during a full scan
+        self.scan_workers: int = max(1, int(kwargs.get("scan_workers", 4)))
+
+        # Watcher backend: "native" (inotify / FSEvents / ReadDirectoryChangesW) or "polling"
+        # (periodic os.scandir snapshots; no per-directory watch descriptors, so it suits
+        # huge trees that exhaust inotify limits). Unknown values fall back to native.
+        watch_backend = str(kwargs.get("watch_backend", "native")).lower()
+        self.watch_backend: str = watch_backend if watch_backend in ("native", "polling") else "native"
+        self.watch_poll_interval: float = max(0.5, float(kwargs.get("watch_poll_interval", 5)))
 
         # Web dashboard settings
         self.web_port: int = int(kwargs.get("web_port", 8765))
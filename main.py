@@ -9,6 +9,7 @@ from pathlib import Path
 
 from aws_copier.core.file_listener import FileListener
 from aws_copier.core.folder_watcher import FolderWatcher
+from aws_copier.core.hashing import shutdown_hash_pool
 from aws_copier.core.s3_manager import S3Manager
 from aws_copier.models.simple_config import SimpleConfig, load_config
 from aws_copier.web.dashboard import WebDashboard
@@ -148,6 +149,9 @@ class AWSCopierApp:
             await self.s3_manager.close()
             logger.info("✅ S3 Manager closed")
 
+            # Release the MD5 thread pool; joined off-loop since a hash may still be finishing.
+            await asyncio.to_thread(shutdown_hash_pool)
+
             # Step 4: shut down the web dashboard last so final log lines are visible.
             if self.web_dashboard is not None:
                 await self.web_dashboard.stop()
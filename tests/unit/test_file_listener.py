@@ -58,6 +58,12 @@ def mock_s3_manager():
     mock = AsyncMock()
     mock.upload_file.return_value = True
     mock.check_exists.return_value = False
+
+    async def _check_exists_many(expected_md5s, max_concurrency=64):
+        # Mirror S3Manager.check_exists_many by delegating to the per-key mock
+        return {key: await mock.check_exists(key, md5) is True for key, md5 in expected_md5s.items()}
+
+    mock.check_exists_many.side_effect = _check_exists_many
     return mock
 
 
@@ -109,7 +115,7 @@ class TestFileListenerCore:
 
         expected_md5 = hashlib.md5("Content of file 1".encode()).hexdigest()
 
-        # New format: each entry is a {md5, mtime} dict
+        # New format: each entry is a {md5, size, mtime_ns} dict
         assert root_data["files"]["file1.txt"]["md5"] == expected_md5
 
     async def test_incremental_scan_skips_unchanged_files(self, file_listener, temp_watch_folder):
@@ -170,6 +176,96 @@ class TestFileListenerCore:
         uploaded_files = [call[0][0].name for call in upload_calls]
         assert "new_file.txt" in uploaded_files
 
+    async def test_scan_prunes_ignored_directories(self, file_listener, temp_watch_folder):
+        """Ignored directories are pruned from the walk and never get a backup info file."""
+        ignored = temp_watch_folder / "node_modules" / "pkg"
+        ignored.mkdir(parents=True)
+        (ignored / "index.js").write_text("module.exports = 1")
+
+        await file_listener.scan_all_folders()
+
+        assert not (temp_watch_folder / "node_modules" / ".milo_backup.info").exists()
+        assert not (ignored / ".milo_backup.info").exists()
+        uploaded = [c.args[0].name for c in file_listener.s3_manager.upload_file.call_args_list]
+        assert "index.js" not in uploaded
+        # root, subdir and subdir/nested
+        assert file_listener.get_statistics()["scanned_folders"] == 3
+
+    async def test_scan_with_single_worker_processes_all_folders(self, test_config, mock_s3_manager, temp_watch_folder):
+        """A single scan worker still drains the whole walk."""
+        test_config.scan_workers = 1
+        fl = FileListener(test_config, mock_s3_manager)
+
+        await fl.scan_all_folders()
+
+        assert (temp_watch_folder / "subdir" / "nested" / ".milo_backup.info").exists()
+        assert mock_s3_manager.upload_file.call_count == 5
+
+    async def test_walk_runs_off_the_event_loop_thread(self, file_listener, temp_watch_folder):
+        """The blocking os.walk runs on a worker thread, not the loop thread."""
+        import threading
+        from unittest.mock import patch
+
+        walk_threads = set()
+        real_walk = file_listener._walk
+
+        def spy_walk(root):
+            walk_threads.add(threading.current_thread())
+            return real_walk(root)
+
+        with patch.object(file_listener, "_walk", side_effect=spy_walk):
+            await file_listener.scan_all_folders()
+
+        assert walk_threads and threading.current_thread() not in walk_threads
+        assert file_listener.get_statistics()["scanned_folders"] == 3
+
+    async def test_watch_folders_scanned_concurrently(self, tmp_path, mock_s3_manager):
+        """Both roots start before either finishes; a failing root does not stop the other."""
+        roots = [tmp_path / "disk_a", tmp_path / "disk_b"]
+        for root in roots:
+            root.mkdir()
+        config = SimpleConfig(
+            aws_access_key_id="x",
+            aws_secret_access_key="y",
+            aws_region="us-east-1",
+            s3_bucket="b",
+            s3_prefix="",
+            watch_folders=[str(r) for r in roots],
+        )
+        fl = FileListener(config, mock_s3_manager)
+        events = []
+
+        async def fake_process(folder_path):
+            events.append(("start", folder_path.name))
+            await asyncio.sleep(0.01)
+            events.append(("end", folder_path.name))
+            if folder_path.name == "disk_a":
+                raise RuntimeError("disk gone")
+
+        fl._process_folder_recursively = fake_process
+        await fl.scan_all_folders()
+
+        assert events[:2] == [("start", "disk_a"), ("start", "disk_b")]
+        assert ("end", "disk_b") in events
+        assert fl.get_statistics()["errors"] == 1
+
+    async def test_walk_into_queue_stops_when_abandoned(self, file_listener, temp_watch_folder):
+        """With a full queue and stop set, the walker thread returns instead of blocking forever."""
+        import threading
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        stop = threading.Event()
+        walker = asyncio.ensure_future(
+            asyncio.to_thread(
+                file_listener._walk_into_queue, temp_watch_folder, queue, asyncio.get_running_loop(), stop
+            )
+        )
+        await asyncio.sleep(0.1)
+        assert queue.full() and not walker.done()
+
+        stop.set()
+        await asyncio.wait_for(walker, timeout=5)
+
 
 class TestFileListenerOperations:
     """Test specific FileListener operations."""
@@ -193,7 +289,7 @@ class TestFileListenerOperations:
         assert "file4.txt" in data["files"]
 
     async def test_scan_current_files(self, file_listener, temp_watch_folder):
-        """Test scanning files in a folder — returns {md5, mtime} dicts (new format)."""
+        """Test scanning files in a folder — returns {md5, size, mtime_ns} dicts (new format)."""
         folder_path = temp_watch_folder
 
         current_files = await file_listener._scan_current_files(folder_path)
@@ -207,7 +303,70 @@ class TestFileListenerOperations:
 
         expected_md5 = hashlib.md5("Content of file 1".encode()).hexdigest()
         assert current_files["file1.txt"]["md5"] == expected_md5
-        assert "mtime" in current_files["file1.txt"]
+        assert current_files["file1.txt"]["size"] == len("Content of file 1")
+        assert "mtime_ns" in current_files["file1.txt"]
+
+    async def test_scan_current_files_skips_non_regular_entries(self, file_listener, tmp_path):
+        """Only regular files (or symlinks to them) are hashed; FIFOs and broken links are skipped."""
+        import os
+
+        (tmp_path / "real.txt").write_text("data")
+        try:
+            os.symlink(tmp_path / "missing.txt", tmp_path / "broken.txt")
+            os.symlink(tmp_path / "real.txt", tmp_path / "alias.txt")
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported on this platform")
+        if hasattr(os, "mkfifo"):
+            os.mkfifo(tmp_path / "pipe.txt")
+
+        current_files = await file_listener._scan_current_files(tmp_path)
+
+        assert sorted(current_files) == ["alias.txt", "real.txt"]
+
+    async def test_scan_current_files_lists_off_the_event_loop_thread(self, file_listener, tmp_path):
+        """Directory listing and stats run on a worker thread; ignore/skip counts still reach the stats."""
+        import threading
+        from unittest.mock import patch
+
+        (tmp_path / "keep.txt").write_text("data")
+        (tmp_path / "junk.tmp").write_text("tmp")
+        list_threads = set()
+        real_list = file_listener._list_folder_files
+
+        def spy_list(*args):
+            list_threads.add(threading.current_thread())
+            return real_list(*args)
+
+        ignored_before = file_listener._stats["ignored_files"]
+        with patch.object(file_listener, "_list_folder_files", side_effect=spy_list):
+            current_files = await file_listener._scan_current_files(tmp_path)
+
+        assert list(current_files) == ["keep.txt"]
+        assert list_threads and threading.current_thread() not in list_threads
+        assert file_listener._stats["ignored_files"] == ignored_before + 1
+
+    async def test_scan_current_files_bounds_hash_workers(self, file_listener, tmp_path, monkeypatch):
+        """Hashing runs on a fixed worker pool: every file is hashed, never more than 2x pool size at once."""
+        import aws_copier.core.file_listener as flmod
+
+        monkeypatch.setattr(flmod, "HASH_POOL_WORKERS", 1)
+        for i in range(12):
+            (tmp_path / f"h{i}.txt").write_text(f"content {i}")
+        live = {"now": 0, "peak": 0}
+
+        async def slow_md5(file_path):
+            live["now"] += 1
+            live["peak"] = max(live["peak"], live["now"])
+            await asyncio.sleep(0.005)
+            live["now"] -= 1
+            return "m-" + file_path.name
+
+        monkeypatch.setattr(file_listener, "_calculate_md5", slow_md5)
+
+        current_files = await file_listener._scan_current_files(tmp_path)
+
+        assert {name: e["md5"] for name, e in current_files.items()} == {f"h{i}.txt": f"m-h{i}.txt" for i in range(12)}
+        assert live["peak"] <= 2
 
     async def test_determine_files_to_upload_new_files(self, file_listener):
         """Test determining which files need upload when all are new."""
@@ -236,22 +395,43 @@ class TestFileListenerOperations:
 
         assert files_to_upload == []
 
+    async def test_determine_files_to_upload_compares_md5_not_fingerprint(self, file_listener):
+        """A touched file (new mtime, same MD5) is not uploaded; skipped_files counts every unchanged file."""
+        kept = {"md5": "m1", "size": 1, "mtime_ns": 1}
+        existing_backup_info = {
+            "same.txt": kept,
+            "touched.txt": {"md5": "m2", "size": 2, "mtime_ns": 2},
+            "old.txt": "m3",
+        }
+        current_files = {
+            "same.txt": kept,
+            "touched.txt": {"md5": "m2", "size": 2, "mtime_ns": 99},
+            "old.txt": {"md5": "m3-new", "size": 3, "mtime_ns": 3},
+            "new.txt": {"md5": "m4", "size": 4, "mtime_ns": 4},
+        }
+
+        files_to_upload = file_listener._determine_files_to_upload(current_files, existing_backup_info)
+
+        assert files_to_upload == ["old.txt", "new.txt"]
+        assert file_listener.get_statistics()["skipped_files"] == 2
+
 
 class TestFileListenerUploads:
     """Test FileListener upload operations."""
 
     async def test_upload_files_success(self, file_listener, temp_watch_folder):
-        """Test successful file upload — _upload_files now returns Dict[str, float]."""
+        """Test successful file upload — _upload_files returns Dict[str, {size, mtime_ns}]."""
         files_to_upload = ["file1.txt", "file2.txt"]
 
-        upload_mtimes = await file_listener._upload_files(files_to_upload, temp_watch_folder)
+        upload_fingerprints = await file_listener._upload_files(files_to_upload, temp_watch_folder)
 
-        # Concurrent gather returns a dict of successfully uploaded filename -> upload_mtime
-        assert len(upload_mtimes) == 2
-        assert set(upload_mtimes.keys()) == {"file1.txt", "file2.txt"}
-        # Each value is a float mtime
-        for mtime in upload_mtimes.values():
-            assert isinstance(mtime, float)
+        # Concurrent gather returns a dict of successfully uploaded filename -> fingerprint
+        assert len(upload_fingerprints) == 2
+        assert set(upload_fingerprints.keys()) == {"file1.txt", "file2.txt"}
+        # Each value is a {size, mtime_ns} fingerprint
+        for fingerprint in upload_fingerprints.values():
+            assert isinstance(fingerprint["size"], int)
+            assert isinstance(fingerprint["mtime_ns"], int)
 
         # Verify S3Manager was called
         assert file_listener.s3_manager.upload_file.call_count == 2
@@ -265,33 +445,33 @@ class TestFileListenerUploads:
 
         upload_mtimes = await file_listener._upload_files(files_to_upload, temp_watch_folder)
 
-        # When check_exists returns True, _upload_single_file returns (True, mtime), so filename is in dict
+        # When check_exists returns True, _upload_single_file returns (True, fingerprint), so filename is in dict
         assert len(upload_mtimes) == 1
         assert "file1.txt" in upload_mtimes
         file_listener.s3_manager.upload_file.assert_not_called()
 
     async def test_upload_single_file_success(self, file_listener, temp_watch_folder):
-        """Test uploading a single file — returns (True, mtime) tuple."""
+        """Test uploading a single file — returns (True, fingerprint) tuple."""
         filename = "file1.txt"
 
-        ok, upload_mtime = await file_listener._upload_single_file(filename, temp_watch_folder)
+        ok, fingerprint = await file_listener._upload_single_file(filename, temp_watch_folder)
 
         assert ok is True
-        assert isinstance(upload_mtime, float)
-        assert upload_mtime > 0.0
+        assert fingerprint["size"] == len("Content of file 1")
+        assert fingerprint["mtime_ns"] > 0
         file_listener.s3_manager.upload_file.assert_called_once()
 
     async def test_upload_single_file_already_exists(self, file_listener, temp_watch_folder):
-        """Test uploading a file that already exists in S3 — returns (True, mtime) tuple."""
+        """Test uploading a file that already exists in S3 — returns (True, fingerprint) tuple."""
         # Configure mock to return True for check_exists
         file_listener.s3_manager.check_exists.return_value = True
 
         filename = "file1.txt"
 
-        ok, upload_mtime = await file_listener._upload_single_file(filename, temp_watch_folder)
+        ok, fingerprint = await file_listener._upload_single_file(filename, temp_watch_folder)
 
         assert ok is True
-        assert isinstance(upload_mtime, float)
+        assert isinstance(fingerprint["mtime_ns"], int)
         file_listener.s3_manager.upload_file.assert_not_called()
 
     async def test_concurrent_upload_with_semaphore(self, file_listener, temp_watch_folder):
@@ -398,7 +578,7 @@ class TestFileListenerBackupInfo:
     """Test FileListener backup info management."""
 
     async def test_load_backup_info_existing_file(self, file_listener, temp_watch_folder):
-        """Test loading existing backup info file — old string format is migrated to {md5, mtime}."""
+        """Test loading existing backup info file — old string format is migrated to {md5, size, mtime_ns}."""
         # Create a backup info file with the old string format
         backup_info_file = temp_watch_folder / ".milo_backup.info"
         test_data = {
@@ -409,12 +589,12 @@ class TestFileListenerBackupInfo:
         with open(backup_info_file, "w") as f:
             json.dump(test_data, f)
 
-        # Load backup info — old string entries are migrated to new {md5, mtime} dict format (D-01)
+        # Load backup info — old string entries are migrated to new dict format (D-01)
         loaded_info = await file_listener._load_backup_info(backup_info_file)
 
         assert loaded_info == {
-            "file1.txt": {"md5": "md5_hash_1", "mtime": 0.0},
-            "file2.txt": {"md5": "md5_hash_2", "mtime": 0.0},
+            "file1.txt": {"md5": "md5_hash_1", "size": -1, "mtime_ns": 0},
+            "file2.txt": {"md5": "md5_hash_2", "size": -1, "mtime_ns": 0},
         }
 
     async def test_load_backup_info_nonexistent_file(self, file_listener, temp_watch_folder):
@@ -426,11 +606,11 @@ class TestFileListenerBackupInfo:
         assert loaded_info == {}
 
     async def test_update_backup_info(self, file_listener, temp_watch_folder):
-        """Test updating backup info file with new {md5, mtime} dict format (D-03)."""
+        """Test updating backup info file with new {md5, size, mtime_ns} dict format (D-03)."""
         backup_info_file = temp_watch_folder / ".milo_backup.info"
         current_files = {
-            "file1.txt": {"md5": "md5_hash_1", "mtime": 1.0},
-            "file2.txt": {"md5": "md5_hash_2", "mtime": 2.0},
+            "file1.txt": {"md5": "md5_hash_1", "size": 1, "mtime_ns": 1000},
+            "file2.txt": {"md5": "md5_hash_2", "size": 2, "mtime_ns": 2000},
         }
 
         await file_listener._update_backup_info(backup_info_file, current_files)
@@ -443,6 +623,7 @@ class TestFileListenerBackupInfo:
             data = json.load(f)
 
         assert "timestamp" in data
+        assert data["version"] == 2
         assert data["files"] == current_files
 
 
@@ -550,6 +731,23 @@ class TestFileListenerS3KeyBuilding:
         s3_key = file_listener._build_s3_key(root_file)
         assert s3_key == "MyDocs/readme.txt"
 
+    def test_build_s3_key_sibling_with_common_prefix(self, mock_s3_manager):
+        """A folder whose name merely starts with a watch folder's name is not inside it."""
+        config = SimpleConfig(watch_folders={"/data/docs": "Docs", "/data/docs-archive": "Archive"})
+        file_listener = FileListener(config, mock_s3_manager)
+
+        assert file_listener._build_s3_key(Path("/data/docs-archive/a.txt")) == "Archive/a.txt"
+        assert file_listener._build_s3_key(Path("/data/docs/a.txt")) == "Docs/a.txt"
+
+    def test_resolve_watch_root_for_root_and_nested(self, mock_s3_manager):
+        """_resolve_watch_root maps the root itself and nested folders to the watch folder."""
+        config = SimpleConfig(watch_folders={"/data/docs": "Docs"})
+        file_listener = FileListener(config, mock_s3_manager)
+
+        assert file_listener._resolve_watch_root(Path("/data/docs")) == Path("/data/docs")
+        assert file_listener._resolve_watch_root(Path("/data/docs/a/b")) == Path("/data/docs")
+        assert file_listener._resolve_watch_root(Path("/elsewhere")) == Path("/elsewhere")
+
 
 class TestFileListenerConfig:
     """CONFIG-01: upload_semaphore respects config.max_concurrent_uploads."""
@@ -568,6 +766,71 @@ class TestFileListenerConfig:
         fl = FileListener(config, AsyncMock())
         assert fl.upload_semaphore._value == 7
 
+    async def test_large_files_use_large_upload_semaphore(self, file_listener, temp_watch_folder, monkeypatch):
+        """Files above the multipart threshold take a large-upload slot, small files a regular one."""
+        import aws_copier.core.file_listener as flmod
+
+        monkeypatch.setattr(flmod, "MULTIPART_THRESHOLD", 10)
+        (temp_watch_folder / "tiny.txt").write_text("abc")
+        seen = {}
+
+        async def record(file_path, s3_key, **kwargs):
+            seen[file_path.name] = (
+                file_listener.upload_semaphore._value,
+                file_listener.large_upload_semaphore._value,
+            )
+            return True
+
+        file_listener.s3_manager.upload_file.side_effect = record
+        await file_listener._upload_single_file("file1.txt", temp_watch_folder)
+        await file_listener._upload_single_file("tiny.txt", temp_watch_folder)
+
+        small_limit = file_listener.config.max_concurrent_uploads
+        large_limit = file_listener.config.max_concurrent_large_uploads
+        assert seen["file1.txt"] == (small_limit, large_limit - 1)
+        assert seen["tiny.txt"] == (small_limit - 1, large_limit)
+
+    async def test_large_uploads_get_size_proportional_timeout(self, file_listener, temp_watch_folder, monkeypatch):
+        """Multipart-sized uploads get a deadline scaled to their size; small ones keep 300s."""
+        import aws_copier.core.file_listener as flmod
+
+        monkeypatch.setattr(flmod, "MULTIPART_THRESHOLD", 10)
+        monkeypatch.setattr(flmod, "LARGE_UPLOAD_MIN_BYTES_PER_SECOND", 1)
+        timeouts = {}
+        real_wait_for = asyncio.wait_for
+
+        async def spy_wait_for(coro, timeout):
+            timeouts[len(timeouts)] = timeout
+            return await real_wait_for(coro, timeout)
+
+        monkeypatch.setattr(flmod.asyncio, "wait_for", spy_wait_for)
+        file_listener.s3_manager.upload_file.return_value = True
+
+        await file_listener._upload_with_timeout(
+            "huge.bin", temp_watch_folder, {"md5": "m", "size": 900, "mtime_ns": 1}
+        )
+        await file_listener._upload_with_timeout("big.bin", temp_watch_folder, {"md5": "m", "size": 11, "mtime_ns": 1})
+        await file_listener._upload_with_timeout("small.bin", temp_watch_folder, {"md5": "m", "size": 5, "mtime_ns": 1})
+
+        # 900 bytes at 1 B/s; a large file never gets less than the small-file window
+        assert timeouts == {0: 900, 1: 300, 2: 300}
+
+    async def test_upload_timeout_message_reports_actual_limit(
+        self, file_listener, temp_watch_folder, caplog, monkeypatch
+    ):
+        """The timeout log line names the limit that actually expired."""
+        import aws_copier.core.file_listener as flmod
+
+        async def hang(file_path, s3_key, **kwargs):
+            await asyncio.Event().wait()
+
+        monkeypatch.setattr(flmod, "UPLOAD_TIMEOUT_SECONDS", 0.05)
+        file_listener.s3_manager.upload_file.side_effect = hang
+        name, ok, _ = await file_listener._upload_with_timeout("file1.txt", temp_watch_folder)
+
+        assert (name, ok) == ("file1.txt", False)
+        assert "Upload timeout for file1.txt (after 0.05s)" in caplog.text
+
 
 class TestFileListenerAsyncBackupIO:
     """ASYNC-03: backup info I/O uses aiofiles under a per-folder asyncio.Lock."""
@@ -577,11 +840,11 @@ class TestFileListenerAsyncBackupIO:
         from unittest.mock import patch
 
         backup_file = tmp_path / ".milo_backup.info"
-        # Write old string format — should be migrated to {md5, mtime} dict on load (D-01)
+        # Write old string format — should be migrated to {md5, size, mtime_ns} dict on load (D-01)
         backup_file.write_text('{"timestamp": "2026-01-01T00:00:00", "files": {"a.txt": "hash1"}}')
         with patch("aws_copier.core.file_listener.aiofiles.open", wraps=__import__("aiofiles").open) as mock_open:
             result = await file_listener._load_backup_info(backup_file)
-        assert result == {"a.txt": {"md5": "hash1", "mtime": 0.0}}
+        assert result == {"a.txt": {"md5": "hash1", "size": -1, "mtime_ns": 0}}
         assert mock_open.call_count == 1
 
     async def test_update_backup_info_uses_aiofiles_and_lock(self, file_listener, tmp_path):
@@ -589,7 +852,7 @@ class TestFileListenerAsyncBackupIO:
         from unittest.mock import patch
 
         backup_file = tmp_path / ".milo_backup.info"
-        new_format_files = {"a.txt": {"md5": "hash1", "mtime": 1.0}}
+        new_format_files = {"a.txt": {"md5": "hash1", "size": 5, "mtime_ns": 1000}}
         with patch("aws_copier.core.file_listener.aiofiles.open", wraps=__import__("aiofiles").open) as mock_open:
             await file_listener._update_backup_info(backup_file, new_format_files)
         assert backup_file.exists()
@@ -650,6 +913,126 @@ class TestFileListenerConcurrentUpload:
         # After gather completes, the done_callback has discarded every task.
         assert len(file_listener._active_upload_tasks) == 0
 
+    async def test_upload_files_bounds_live_tasks(self, file_listener, temp_watch_folder):
+        """Only a bounded number of upload tasks exist at once, however many files are pending."""
+        file_listener.config.max_concurrent_uploads = 2
+        file_listener.config.max_concurrent_large_uploads = 1
+        peak = {"tasks": 0}
+
+        async def tracking_upload(file_path, s3_key, **kwargs):
+            peak["tasks"] = max(peak["tasks"], len(file_listener._active_upload_tasks))
+            await asyncio.sleep(0.01)
+            return True
+
+        file_listener.s3_manager.check_exists = AsyncMock(return_value=False)
+        file_listener.s3_manager.upload_file = AsyncMock(side_effect=tracking_upload)
+
+        files = [f"q{i}.txt" for i in range(20)]
+        for name in files:
+            (temp_watch_folder / name).write_text("x")
+
+        uploaded = await file_listener._upload_files(files, temp_watch_folder)
+
+        assert set(uploaded) == set(files)
+        assert 1 <= peak["tasks"] <= 3
+
+    async def test_blocked_large_uploads_do_not_starve_small_files(self, file_listener, temp_watch_folder, monkeypatch):
+        """A batch that starts with many large files still finishes its small files while large uploads hang."""
+        import aws_copier.core.file_listener as flmod
+
+        monkeypatch.setattr(flmod, "MULTIPART_THRESHOLD", 10)
+        file_listener.config.max_concurrent_uploads = 2
+        file_listener.config.max_concurrent_large_uploads = 2
+        release_large = asyncio.Event()
+        small_done = set()
+
+        async def gated_upload(file_path, s3_key, **kwargs):
+            if file_path.name.startswith("big"):
+                await release_large.wait()
+            else:
+                small_done.add(file_path.name)
+            return True
+
+        file_listener.s3_manager.check_exists = AsyncMock(return_value=False)
+        file_listener.s3_manager.upload_file = AsyncMock(side_effect=gated_upload)
+
+        large = [f"big{i}.bin" for i in range(8)]
+        small = [f"small{i}.txt" for i in range(4)]
+        for name in large:
+            (temp_watch_folder / name).write_text("x" * 32)
+        for name in small:
+            (temp_watch_folder / name).write_text("x")
+
+        upload = asyncio.create_task(file_listener._upload_files(large + small, temp_watch_folder))
+        try:
+            for _ in range(200):
+                if small_done == set(small):
+                    break
+                await asyncio.sleep(0.01)
+            assert small_done == set(small)
+            assert not upload.done()
+        finally:
+            release_large.set()
+        uploaded = await upload
+
+        assert set(uploaded) == set(large + small)
+
+    async def test_cancelling_upload_files_leaves_no_tasks_behind(self, file_listener, temp_watch_folder):
+        """Cancelling _upload_files mid-flight takes down its workers and their uploads."""
+        file_listener.config.max_concurrent_uploads = 2
+
+        async def hang(file_path, s3_key, **kwargs):
+            await asyncio.Event().wait()
+
+        file_listener.s3_manager.check_exists = AsyncMock(return_value=False)
+        file_listener.s3_manager.upload_file = AsyncMock(side_effect=hang)
+
+        files = [f"f{i}.txt" for i in range(6)]
+        for name in files:
+            (temp_watch_folder / name).write_text("x")
+
+        before = asyncio.all_tasks()
+        outer = asyncio.create_task(file_listener._upload_files(files, temp_watch_folder))
+        for _ in range(200):
+            if len(file_listener._active_upload_tasks) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert len(file_listener._active_upload_tasks) == 2
+
+        outer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await outer
+        await asyncio.sleep(0)
+
+        assert asyncio.all_tasks() - before - {outer} == set()
+        assert file_listener._active_upload_tasks == set()
+        assert file_listener.s3_manager.upload_file.await_count == 2
+
+    async def test_drain_cancelled_upload_is_recorded_as_failed(self, file_listener, temp_watch_folder):
+        """An upload cancelled from outside (shutdown drain) fails that file only; the batch continues."""
+
+        async def hang_on_a(file_path, s3_key, **kwargs):
+            if file_path.name == "a.txt":
+                await asyncio.Event().wait()
+            return True
+
+        file_listener.s3_manager.check_exists = AsyncMock(return_value=False)
+        file_listener.s3_manager.upload_file = AsyncMock(side_effect=hang_on_a)
+
+        files = ["a.txt", "b.txt"]
+        for name in files:
+            (temp_watch_folder / name).write_text("x")
+
+        outer = asyncio.create_task(file_listener._upload_files(files, temp_watch_folder))
+        for _ in range(200):
+            hanging = [t for t in file_listener._active_upload_tasks if t.get_name().endswith("a.txt")]
+            if hanging:
+                break
+            await asyncio.sleep(0.01)
+        hanging[0].cancel()
+
+        assert set(await outer) == {"b.txt"}
+
     async def test_upload_files_gather_handles_exceptions(self, file_listener, temp_watch_folder):
         """One raising coroutine must not cancel the rest; return_exceptions=True preserves partial success."""
         calls = {"n": 0}
@@ -671,6 +1054,27 @@ class TestFileListenerConcurrentUpload:
         # Exactly one failed; two succeeded.
         assert len(uploaded) == 2
 
+    async def test_upload_files_failed_upload_counts_one_error_and_is_not_recorded(
+        self, file_listener, temp_watch_folder
+    ):
+        """A plain failed upload (False) is counted once and keyed by filename, never recorded as True."""
+
+        async def fail_b(file_path, s3_key, **kwargs):
+            return file_path.name != "b.txt"
+
+        file_listener.s3_manager.check_exists = AsyncMock(return_value=False)
+        file_listener.s3_manager.upload_file = AsyncMock(side_effect=fail_b)
+
+        files = ["a.txt", "b.txt"]
+        for name in files:
+            (temp_watch_folder / name).write_text("x")
+
+        uploaded = await file_listener._upload_files(files, temp_watch_folder)
+
+        assert set(uploaded) == {"a.txt"}
+        assert all(isinstance(v, dict) for v in uploaded.values())
+        assert file_listener.get_statistics()["errors"] == 1
+
 
 class TestFileListenerIgnoreIntegration:
     """IGNORE-03: FileListener delegates to IGNORE_RULES. IGNORE-04: ignored files increment stats."""
@@ -699,23 +1103,32 @@ class TestBackupInfoMigrationAndCache:
     """PERF-01 / PERF-02: backup info format migration and in-memory cache."""
 
     async def test_load_migrates_old_string_format(self, file_listener, temp_watch_folder):
-        """Old string-format entries are migrated to {md5, mtime} dict on read (D-01)."""
+        """Old string-format entries are migrated to {md5, size, mtime_ns} dict on read (D-01)."""
         import json
 
         backup_file = temp_watch_folder / ".milo_backup.info"
         backup_file.write_text(json.dumps({"files": {"a.txt": "abc123"}}))
         result = await file_listener._load_backup_info(backup_file)
-        assert result == {"a.txt": {"md5": "abc123", "mtime": 0.0}}
+        assert result == {"a.txt": {"md5": "abc123", "size": -1, "mtime_ns": 0}}
+
+    async def test_load_migrates_float_mtime_dict_format(self, file_listener, temp_watch_folder):
+        """{md5, mtime} entries lack a size/mtime_ns fingerprint and are migrated to force a re-hash."""
+        import json
+
+        backup_file = temp_watch_folder / ".milo_backup.info"
+        backup_file.write_text(json.dumps({"files": {"a.txt": {"md5": "abc123", "mtime": 1234.5}}}))
+        result = await file_listener._load_backup_info(backup_file)
+        assert result == {"a.txt": {"md5": "abc123", "size": -1, "mtime_ns": 0}}
 
     async def test_load_preserves_new_dict_format(self, file_listener, temp_watch_folder):
         """New dict-format entries pass through unchanged."""
         import json
 
         backup_file = temp_watch_folder / ".milo_backup.info"
-        payload = {"files": {"a.txt": {"md5": "abc123", "mtime": 1234.5}}}
+        payload = {"files": {"a.txt": {"md5": "abc123", "size": 7, "mtime_ns": 1234500000000}}}
         backup_file.write_text(json.dumps(payload))
         result = await file_listener._load_backup_info(backup_file)
-        assert result == {"a.txt": {"md5": "abc123", "mtime": 1234.5}}
+        assert result == {"a.txt": {"md5": "abc123", "size": 7, "mtime_ns": 1234500000000}}
 
     async def test_load_returns_empty_when_file_missing(self, file_listener, temp_watch_folder):
         """Non-existent backup info file returns empty dict."""
@@ -728,7 +1141,7 @@ class TestBackupInfoMigrationAndCache:
         import json
 
         backup_file = temp_watch_folder / ".milo_backup.info"
-        backup_file.write_text(json.dumps({"files": {"a.txt": {"md5": "x", "mtime": 1.0}}}))
+        backup_file.write_text(json.dumps({"files": {"a.txt": {"md5": "x", "size": 1, "mtime_ns": 1000}}}))
         # First call populates cache
         await file_listener._load_backup_info(backup_file)
         # Spy on aiofiles.open via patch — second call must NOT read disk
@@ -738,7 +1151,7 @@ class TestBackupInfoMigrationAndCache:
         with patch.object(flmod, "aiofiles") as mock_af:
             result = await file_listener._load_backup_info(backup_file)
             mock_af.open.assert_not_called()
-        assert result == {"a.txt": {"md5": "x", "mtime": 1.0}}
+        assert result == {"a.txt": {"md5": "x", "size": 1, "mtime_ns": 1000}}
 
     async def test_load_re_reads_when_disk_mtime_changes(self, file_listener, temp_watch_folder):
         """Disk read is triggered when .milo_backup.info mtime changes (cache miss)."""
@@ -756,15 +1169,49 @@ class TestBackupInfoMigrationAndCache:
         assert second["a.txt"]["md5"] == "new"
 
     async def test_update_writes_dict_format(self, file_listener, temp_watch_folder):
-        """_update_backup_info writes {md5, mtime} dict values to disk (D-03)."""
+        """_update_backup_info writes {md5, size, mtime_ns} dict values to disk (D-03)."""
         import json
 
         backup_file = temp_watch_folder / ".milo_backup.info"
-        payload = {"a.txt": {"md5": "x", "mtime": 1.0}}
+        payload = {"a.txt": {"md5": "x", "size": 1, "mtime_ns": 1000}}
         ok = await file_listener._update_backup_info(backup_file, payload)
         assert ok is True
         raw = json.loads(backup_file.read_text())
-        assert raw["files"]["a.txt"] == {"md5": "x", "mtime": 1.0}
+        assert raw["files"]["a.txt"] == {"md5": "x", "size": 1, "mtime_ns": 1000}
+
+    async def test_update_is_atomic_and_leaves_no_temp_file(self, file_listener, temp_watch_folder):
+        """The manifest is swapped in via os.replace; the temp file does not linger."""
+        import json
+        from unittest.mock import patch
+
+        backup_file = temp_watch_folder / ".milo_backup.info"
+        backup_file.write_text(json.dumps({"files": {"a.txt": {"md5": "v1", "size": 1, "mtime_ns": 1}}}))
+
+        with patch("aws_copier.core.file_listener.os.replace", wraps=__import__("os").replace) as spy:
+            ok = await file_listener._update_backup_info(
+                backup_file, {"a.txt": {"md5": "v2", "size": 1, "mtime_ns": 2}}
+            )
+        assert ok is True
+        spy.assert_called_once()
+        assert not (temp_watch_folder / ".milo_backup.info.tmp").exists()
+        assert json.loads(backup_file.read_text())["files"]["a.txt"]["md5"] == "v2"
+
+    async def test_failed_update_keeps_previous_manifest(self, file_listener, temp_watch_folder):
+        """If the swap fails, the old manifest is untouched and the temp file is removed."""
+        import json
+        from unittest.mock import patch
+
+        backup_file = temp_watch_folder / ".milo_backup.info"
+        original = json.dumps({"files": {"a.txt": {"md5": "v1", "size": 1, "mtime_ns": 1}}})
+        backup_file.write_text(original)
+
+        with patch("aws_copier.core.file_listener.os.replace", side_effect=OSError("disk gone")):
+            ok = await file_listener._update_backup_info(
+                backup_file, {"a.txt": {"md5": "v2", "size": 1, "mtime_ns": 2}}
+            )
+        assert ok is False
+        assert backup_file.read_text() == original
+        assert not (temp_watch_folder / ".milo_backup.info.tmp").exists()
 
     async def test_update_invalidates_cache(self, file_listener, temp_watch_folder):
         """After _update_backup_info, subsequent _load_backup_info reflects the new content."""
@@ -783,7 +1230,7 @@ class TestBackupInfoMigrationAndCache:
 
 
 class TestMtimeSkip:
-    """PERF-01: mtime-skip in _scan_current_files and D-02 upload_mtime capture."""
+    """PERF-01: size+mtime_ns quick-check in _scan_current_files and D-02 fingerprint capture."""
 
     async def test_unchanged_file_skips_md5(self, file_listener, temp_watch_folder):
         """Second scan cycle with unchanged file increments skipped_files, does not call _calculate_md5."""
@@ -830,15 +1277,15 @@ class TestMtimeSkip:
         assert "file1.txt" in upload_paths
 
     async def test_first_run_after_migration_recomputes(self, file_listener, temp_watch_folder):
-        """A migrated old-format entry (mtime=0.0) does not match real st_mtime, so MD5 is recomputed."""
+        """A migrated old-format entry (size=-1, mtime_ns=0) never matches a real stat, so MD5 is recomputed."""
         import json
         import hashlib
         from unittest.mock import patch
 
         # Pre-create .milo_backup.info with old string format
         backup_file = temp_watch_folder / ".milo_backup.info"
-        # Use the correct md5 for file1.txt so the S3 check would skip upload if mtime matched —
-        # but because mtime=0.0 != real st_mtime the file must be re-processed regardless.
+        # Use the correct md5 for file1.txt so the S3 check would skip upload if the fingerprint
+        # matched — but because the migrated fingerprint is size=-1 the file is re-processed regardless.
         real_md5 = hashlib.md5(b"Content of file 1").hexdigest()
         backup_file.write_text(json.dumps({"files": {"file1.txt": real_md5}}))
 
@@ -846,7 +1293,7 @@ class TestMtimeSkip:
             file_listener, "_calculate_md5", wraps=file_listener._calculate_md5
         ) as spy_md5:
             await file_listener._process_current_folder(temp_watch_folder)
-            # _calculate_md5 must have been called for file1.txt (mtime=0.0 forces re-stat)
+            # _calculate_md5 must have been called for file1.txt (migrated fingerprint forces re-hash)
             assert spy_md5.call_count >= 1
 
         # Post-write .milo_backup.info must be in new dict format
@@ -854,7 +1301,8 @@ class TestMtimeSkip:
         for entry in raw["files"].values():
             assert isinstance(entry, dict)
             assert "md5" in entry
-            assert "mtime" in entry
+            assert "size" in entry
+            assert "mtime_ns" in entry
 
     async def test_stored_mtime_is_pre_upload_capture(self, file_listener, temp_watch_folder):
         """The mtime stored in backup info after upload equals the value captured just before upload (D-02)."""
@@ -866,7 +1314,7 @@ class TestMtimeSkip:
 
         async def upload_and_record(file_path, s3_key, **kwargs):
             # Record the mtime at the moment upload is called
-            captured_mtimes[file_path.name] = file_path.stat().st_mtime
+            captured_mtimes[file_path.name] = file_path.stat().st_mtime_ns
             return True
 
         file_listener.s3_manager.upload_file = AsyncMock(side_effect=upload_and_record)
@@ -883,10 +1331,73 @@ class TestMtimeSkip:
                 assert isinstance(stored_entry, dict), f"{filename} not in new format"
                 # The stored mtime must be <= the mtime captured at upload call time
                 # (captured just before upload, not post-modification)
-                assert stored_entry["mtime"] <= captured_mtimes[filename], (
-                    f"{filename}: stored mtime {stored_entry['mtime']} > captured {captured_mtimes[filename]}"
+                assert stored_entry["mtime_ns"] <= captured_mtimes[filename], (
+                    f"{filename}: stored mtime_ns {stored_entry['mtime_ns']} > captured {captured_mtimes[filename]}"
                 )
 
+    async def test_size_change_with_same_mtime_triggers_rehash(self, file_listener, temp_watch_folder):
+        """A size change is detected even when mtime_ns is restored to the stored value."""
+        import os
+        from unittest.mock import patch
+
+        await file_listener._process_current_folder(temp_watch_folder)
+        file1 = temp_watch_folder / "file1.txt"
+        st = file1.stat()
+        file1.write_text("Content of file 1 plus more")
+        os.utime(file1, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        with patch.object(file_listener, "_calculate_md5", wraps=file_listener._calculate_md5) as spy_md5:
+            await file_listener._scan_current_files(
+                temp_watch_folder, await file_listener._load_backup_info(temp_watch_folder / ".milo_backup.info")
+            )
+            hashed = [c.args[0].name for c in spy_md5.call_args_list]
+        assert "file1.txt" in hashed
+
+
+class TestScanMd5Reuse:
+    """Upload path reuses the MD5 computed during the scan instead of hashing twice."""
+
+    async def test_new_file_hashed_once_per_cycle(self, file_listener, temp_watch_folder):
+        """A full cycle over new files computes each file's MD5 exactly once."""
+        from unittest.mock import patch
+
+        with patch.object(file_listener, "_calculate_md5", wraps=file_listener._calculate_md5) as spy_md5:
+            await file_listener._process_current_folder(temp_watch_folder)
+            hashed = sorted(c.args[0].name for c in spy_md5.call_args_list)
+
+        assert hashed == ["file1.txt", "file2.txt"]
+        upload_kwargs = [c.kwargs for c in file_listener.s3_manager.upload_file.call_args_list]
+        assert all(kw["precomputed_md5"] for kw in upload_kwargs)
+
+    async def test_file_changed_after_scan_is_rehashed(self, file_listener, temp_watch_folder):
+        """When the file changes between scan and upload, the MD5 is recomputed and recorded."""
+        import hashlib
+
+        scanned = await file_listener._scan_current_files(temp_watch_folder)
+        (temp_watch_folder / "file1.txt").write_text("Changed after scan, different size")
+
+        uploaded = await file_listener._upload_files(["file1.txt"], temp_watch_folder, scanned)
+
+        expected = hashlib.md5(b"Changed after scan, different size").hexdigest()
+        assert uploaded["file1.txt"]["md5"] == expected
+        kwargs = file_listener.s3_manager.upload_file.call_args.kwargs
+        assert kwargs["precomputed_md5"] == expected
+
+    async def test_bulk_precheck_skips_existing_and_avoids_second_head(self, file_listener, temp_watch_folder):
+        """Files found by the bulk check are not uploaded; missing ones are not HEADed twice."""
+        scanned = await file_listener._scan_current_files(temp_watch_folder)
+        key1 = file_listener._build_s3_key(temp_watch_folder / "file1.txt")
+        file_listener.s3_manager.check_exists_many.side_effect = None
+        file_listener.s3_manager.check_exists_many.return_value = {key1: True}
+
+        uploaded = await file_listener._upload_files(["file1.txt", "file2.txt"], temp_watch_folder, scanned)
+
+        assert set(uploaded) == {"file1.txt", "file2.txt"}
+        assert uploaded["file1.txt"] == scanned["file1.txt"]
+        upload_paths = [c.args[0].name for c in file_listener.s3_manager.upload_file.call_args_list]
+        assert upload_paths == ["file2.txt"]
+        file_listener.s3_manager.check_exists.assert_not_called()
+
 
 class TestBackupignoreCascade:
     """CONFIG-06: per-directory .backupignore with ancestor cascade (D-07, D-08)."""
@@ -928,6 +1439,19 @@ class TestBackupignoreCascade:
         assert "x.tmp" not in uploaded
         assert "y.log" not in uploaded
 
+    async def test_root_backupignore_anchored_path_pattern(self, file_listener, temp_watch_folder, mock_s3_manager):
+        """Anchored patterns match against the path relative to the watch root, not just the name."""
+        (temp_watch_folder / ".backupignore").write_text("/docs/drafts/*.txt\n")
+        drafts = temp_watch_folder / "docs" / "drafts"
+        drafts.mkdir(parents=True)
+        (drafts / "wip.txt").write_text("w")
+        (temp_watch_folder / "docs" / "final.txt").write_text("f")
+        await file_listener._process_current_folder(drafts)
+        await file_listener._process_current_folder(temp_watch_folder / "docs")
+        uploaded = [c.args[0].name for c in mock_s3_manager.upload_file.call_args_list]
+        assert "final.txt" in uploaded
+        assert "wip.txt" not in uploaded
+
     async def test_no_backupignore_no_filtering(self, file_listener, temp_watch_folder, mock_s3_manager):
         """No .backupignore file means no filtering; all normal files are uploaded."""
         (temp_watch_folder / "a.txt").write_text("a")
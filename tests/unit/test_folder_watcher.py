@@ -86,6 +86,16 @@ class TestFolderWatcherCore:
         assert folder_watcher.event_loop is None
         assert len(folder_watcher.handlers) == 0
 
+    def test_polling_backend_uses_polling_observer(self, mock_file_listener, temp_watch_folder):
+        """watch_backend=polling selects watchdog's PollingObserver with the configured interval."""
+        from watchdog.observers.polling import PollingObserver
+
+        config = SimpleConfig(watch_folders=[str(temp_watch_folder)], watch_backend="polling", watch_poll_interval=2)
+        watcher = FolderWatcher(config, mock_file_listener)
+
+        assert isinstance(watcher.observer, PollingObserver)
+        assert watcher.observer.timeout == 2
+
     async def test_start_folder_watcher(self, folder_watcher, temp_watch_folder):
         """Test starting the folder watcher."""
         with patch.object(folder_watcher.observer, "start") as mock_observer_start:
@@ -102,6 +112,43 @@ class TestFolderWatcherCore:
             # Observer should be started
             mock_observer_start.assert_called_once()
 
+    def test_schedule_filters_to_file_create_and_modify(self, folder_watcher, temp_watch_folder):
+        """Watches register an event_filter so other event types never reach Python handlers."""
+        handler = MagicMock()
+        with patch.object(folder_watcher.observer, "schedule", autospec=True) as mock_schedule:
+            folder_watcher._schedule_handler(handler, temp_watch_folder)
+
+        mock_schedule.assert_called_once_with(
+            handler, str(temp_watch_folder), recursive=True, event_filter=[FileCreatedEvent, FileModifiedEvent]
+        )
+
+    def test_schedule_falls_back_without_event_filter_support(self, folder_watcher, temp_watch_folder):
+        """Older watchdog (no event_filter keyword) still gets a recursive watch."""
+        handler = MagicMock()
+        calls = []
+
+        def old_schedule(event_handler, path, recursive=False):
+            calls.append((event_handler, path, recursive))
+
+        with patch.object(folder_watcher.observer, "schedule", new=old_schedule):
+            folder_watcher._schedule_handler(handler, temp_watch_folder)
+
+        assert calls == [(handler, str(temp_watch_folder), True)]
+
+    def test_schedule_does_not_swallow_watchdog_type_errors(self, folder_watcher, temp_watch_folder):
+        """A TypeError raised inside a filter-capable schedule() propagates instead of silently dropping the filter."""
+        calls = []
+
+        def broken_schedule(event_handler, path, *, recursive=False, event_filter=None):
+            calls.append(event_filter)
+            raise TypeError("bug inside watchdog")
+
+        with patch.object(folder_watcher.observer, "schedule", new=broken_schedule):
+            with pytest.raises(TypeError, match="bug inside watchdog"):
+                folder_watcher._schedule_handler(MagicMock(), temp_watch_folder)
+
+        assert calls == [[FileCreatedEvent, FileModifiedEvent]]
+
     async def test_stop_folder_watcher(self, folder_watcher):
         """Test stopping the folder watcher."""
         # Start first
@@ -251,6 +298,25 @@ class TestFileChangeHandler:
 
         assert mock_run.call_count == 0
 
+    @pytest.mark.parametrize("ignored_dir", ["node_modules", ".git", "__pycache__"])
+    def test_on_any_event_inside_ignored_dir_skipped(self, file_change_handler, temp_watch_folder, ignored_dir):
+        """Events for files under directories the scanner prunes are not scheduled."""
+        nested = temp_watch_folder / "subdir" / ignored_dir / "pkg"
+        nested.mkdir(parents=True)
+        inner_file = nested / "index.js"
+        inner_file.write_text("x")
+
+        with patch("aws_copier.core.folder_watcher.asyncio.run_coroutine_threadsafe") as mock_run:
+            file_change_handler.on_any_event(FileModifiedEvent(str(inner_file)))
+
+        assert mock_run.call_count == 0
+
+    def test_in_ignored_dir_only_checks_below_watch_root(self, file_change_handler, temp_watch_folder):
+        """Ignored names in the watch root's own path do not count; the file name itself is not a dir."""
+        assert file_change_handler._in_ignored_dir(str(temp_watch_folder / "subdir" / "node_modules.txt")) is False
+        assert file_change_handler._in_ignored_dir(str(temp_watch_folder / "file1.txt")) is False
+        assert file_change_handler._in_ignored_dir("/elsewhere/.git/config") is False
+
     def test_on_any_event_file_modified(self, file_change_handler, temp_watch_folder):
         """Test handling file modified events."""
         test_file = temp_watch_folder / "file1.txt"
@@ -351,6 +417,46 @@ class TestFileChangeHandler:
         # Should not call file_listener._process_current_folder
         file_change_handler.file_listener._process_current_folder.assert_not_called()
 
+    async def test_burst_in_one_folder_coalesces_folder_scans(self, file_change_handler, temp_watch_folder):
+        """Events arriving while the folder is being processed trigger one rescan, not one each."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_process(folder_path):
+            started.set()
+            await release.wait()
+
+        file_change_handler.file_listener._process_current_folder = AsyncMock(side_effect=slow_process)
+
+        first = asyncio.create_task(file_change_handler._process_changed_file(temp_watch_folder / "f0.txt", "created"))
+        await started.wait()
+        for i in range(1, 10):
+            await file_change_handler._process_changed_file(temp_watch_folder / f"f{i}.txt", "created")
+        release.set()
+        await first
+
+        assert file_change_handler.file_listener._process_current_folder.call_count == 2
+        assert file_change_handler._folder_runs == {}
+
+    async def test_cancelling_trigger_does_not_abort_shared_folder_run(self, file_change_handler, temp_watch_folder):
+        """Cancelling the event that started a folder run leaves the run going for other files."""
+        release = asyncio.Event()
+        done = []
+
+        async def slow_process(folder_path):
+            await release.wait()
+            done.append(folder_path)
+
+        file_change_handler.file_listener._process_current_folder = AsyncMock(side_effect=slow_process)
+
+        trigger = asyncio.create_task(file_change_handler._process_changed_file(temp_watch_folder / "a.txt", "created"))
+        await asyncio.sleep(0.01)
+        trigger.cancel()
+        release.set()
+        await asyncio.sleep(0.01)
+
+        assert done == [temp_watch_folder]
+
 
 class TestFolderWatcherIntegration:
     """Test FolderWatcher integration scenarios."""
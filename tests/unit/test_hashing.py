@@ -0,0 +1,109 @@
+"""Tests for shared MD5 hashing helpers."""
+
+import hashlib
+import threading
+
+import pytest
+
+from aws_copier.core import hashing
+from aws_copier.core.hashing import HASH_CHUNK_SIZE, md5_file, run_in_hash_pool
+
+
+def test_md5_file_matches_hashlib(tmp_path):
+    """md5_file returns the same digest as hashlib for multi-chunk content."""
+    data = b"x" * (HASH_CHUNK_SIZE * 2 + 123)
+    path = tmp_path / "big.bin"
+    path.write_bytes(data)
+
+    assert md5_file(path) == hashlib.md5(data).hexdigest()
+
+
+def test_md5_file_small_file_fast_path(tmp_path):
+    """Files under SMALL_FILE_LIMIT take the single-read path and hash identically."""
+    data = b"small" * 100
+    path = tmp_path / "small.bin"
+    path.write_bytes(data)
+
+    assert len(data) < hashing.SMALL_FILE_LIMIT
+    assert md5_file(path) == hashlib.md5(data).hexdigest()
+
+
+def test_md5_file_empty(tmp_path):
+    """Empty files hash to the well-known empty MD5."""
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+
+    assert md5_file(path) == "d41d8cd98f00b204e9800998ecf8427e"
+
+
+def test_readinto_matches_hashlib(tmp_path):
+    """The reusable-buffer readinto loop produces the same digest as hashlib."""
+    data = bytes(range(256)) * 10000
+    path = tmp_path / "data.bin"
+    path.write_bytes(data)
+
+    with open(path, "rb") as f:
+        assert hashing._md5_readinto(f) == hashlib.md5(data).hexdigest()
+
+
+def test_md5_file_buffer_scales_with_file_size(tmp_path, monkeypatch):
+    """Large files get the bigger read buffer; medium files keep HASH_CHUNK_SIZE."""
+    monkeypatch.setattr(hashing, "LARGE_FILE_LIMIT", 512 * 1024)
+    used = []
+    real_readinto = hashing._md5_readinto
+
+    def spy(f, chunk_size=HASH_CHUNK_SIZE):
+        used.append(chunk_size)
+        return real_readinto(f, chunk_size)
+
+    monkeypatch.setattr(hashing, "_md5_readinto", spy)
+    medium = tmp_path / "medium.bin"
+    medium.write_bytes(b"m" * (hashing.SMALL_FILE_LIMIT * 2))
+    large = tmp_path / "large.bin"
+    large.write_bytes(b"l" * (512 * 1024))
+
+    assert md5_file(medium) == hashlib.md5(medium.read_bytes()).hexdigest()
+    assert md5_file(large) == hashlib.md5(large.read_bytes()).hexdigest()
+    assert used == [HASH_CHUNK_SIZE, hashing.LARGE_HASH_CHUNK_SIZE]
+
+
+def test_md5_file_ignores_fadvise_errors(tmp_path, monkeypatch):
+    """A failing posix_fadvise hint does not affect the digest."""
+    data = b"z" * (hashing.SMALL_FILE_LIMIT + 1)
+    path = tmp_path / "advise.bin"
+    path.write_bytes(data)
+
+    def failing_fadvise(*args):
+        raise OSError("unsupported")
+
+    monkeypatch.setattr(hashing.os, "posix_fadvise", failing_fadvise, raising=False)
+    monkeypatch.setattr(hashing.os, "POSIX_FADV_SEQUENTIAL", 2, raising=False)
+
+    assert md5_file(path) == hashlib.md5(data).hexdigest()
+
+
+def test_md5_file_missing_raises(tmp_path):
+    """Missing files propagate OSError so callers decide how to log it."""
+    with pytest.raises(OSError):
+        md5_file(tmp_path / "missing.bin")
+
+
+async def test_run_in_hash_pool_uses_dedicated_threads():
+    """Work submitted via run_in_hash_pool runs on the md5-prefixed pool threads."""
+    name = await run_in_hash_pool(lambda: threading.current_thread().name)
+
+    assert name.startswith("md5")
+    assert hashing._HASH_POOL._max_workers >= 1
+
+
+async def test_shutdown_hash_pool_releases_threads_and_restarts_lazily():
+    """shutdown_hash_pool joins the md5 threads; the next hash starts a fresh pool."""
+    await run_in_hash_pool(lambda: None)
+    assert hashing._HASH_POOL is not None
+
+    hashing.shutdown_hash_pool()
+
+    assert hashing._HASH_POOL is None
+    assert not [t for t in threading.enumerate() if t.name.startswith("md5")]
+    assert await run_in_hash_pool(lambda: 42) == 42
+    hashing.shutdown_hash_pool()
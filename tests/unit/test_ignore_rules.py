@@ -110,6 +110,82 @@ class TestIgnoreRulesDirs:
         assert IGNORE_RULES.should_ignore_dir(link) is True
 
 
+class TestIgnoreRulesNameVariants:
+    """Name-only helpers used with os.scandir entries agree with the Path-based checks."""
+
+    @pytest.mark.parametrize("name", ["a.bak", "x.pyc", ".env", "id_rsa", "Thumbs.db", "report.pdf", "notes~"])
+    def test_file_name_matches_path_check(self, name):
+        assert IGNORE_RULES.should_ignore_file_name(name) is IGNORE_RULES.should_ignore_file(Path(name))
+
+    def test_dir_name_ignored(self):
+        assert IGNORE_RULES.should_ignore_dir_name("node_modules") is True
+        assert IGNORE_RULES.should_ignore_dir_name(".cache") is True
+        assert IGNORE_RULES.should_ignore_dir_name("src") is False
+
+
+class TestIgnoreRulesPrecompiled:
+    """Precomputed exact-name/suffix tables give the same answers as a per-pattern fnmatch loop."""
+
+    @staticmethod
+    def _reference(name: str) -> bool:
+        import fnmatch
+
+        if name.startswith("."):
+            return True
+        return any(fnmatch.fnmatch(name, p) for p in SENSITIVE_DENY | GLOB_PATTERNS)
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "Thumbs.db",
+            "thumbs.db",
+            "desktop.ini",
+            "hiberfil.sys",
+            "a.tmp",
+            "a.tmp.txt",
+            "x.pyc",
+            "x.py",
+            "backup.bak",
+            "bak",
+            "file~",
+            "~file",
+            "id_rsa",
+            "id_rsa.pub",
+            "cert.pem",
+            "cert.PEM",
+            "secret",
+            "x.secret",
+            "report.pdf",
+            "tmp",
+            "a.swp",
+            "store.p12",
+        ],
+    )
+    def test_matches_fnmatch_reference(self, name):
+        assert IGNORE_RULES.should_ignore_file_name(name) is self._reference(name)
+
+    def test_custom_patterns_are_split(self):
+        rules = IgnoreRules(glob_patterns=frozenset({"exact.txt", "*.log", "data-?.csv"}), sensitive_deny=frozenset())
+        assert rules.should_ignore_file_name("exact.txt") is True
+        assert rules.should_ignore_file_name("app.log") is True
+        assert rules.should_ignore_file_name("data-1.csv") is True
+        assert rules.should_ignore_file_name("data-10.csv") is False
+
+    def test_multiple_globs_share_one_regex(self):
+        """Several non-suffix globs are combined into one alternation without cross-matching."""
+        rules = IgnoreRules(glob_patterns=frozenset({"a?.txt", "b*.log.*", "[xy].csv"}), sensitive_deny=frozenset())
+        assert rules.should_ignore_file_name("a1.txt") is True
+        assert rules.should_ignore_file_name("build.log.1") is True
+        assert rules.should_ignore_file_name("y.csv") is True
+        assert rules.should_ignore_file_name("a1.log.1") is False
+        assert rules.should_ignore_file_name("z.csv") is False
+
+    def test_no_globs_left_after_split(self):
+        """Only exact names and suffixes: nothing else to match, no regex needed."""
+        rules = IgnoreRules(glob_patterns=frozenset({"exact.txt", "*.log"}), sensitive_deny=frozenset())
+        assert rules.should_ignore_file_name("other.txt") is False
+
+
 class TestIgnoreRulesImmutability:
     """D-05: IgnoreRules must be frozen — prevents accidental mutation of the singleton."""
 
@@ -59,11 +59,11 @@ class TestPrecomputedMd5:
         mock_client = AsyncMock()
         mock_client.put_object.return_value = {"ETag": "x"}
         mock_client.head_object.return_value = {
-            "Metadata": {"md5-checksum": "abc"},
+            "Metadata": {"md5-checksum": "ab" * 16},
             "ETag": '"some_etag"',
         }
         with patch.object(s3, "_get_or_create_client", return_value=mock_client), \
-             patch.object(s3, "_calculate_md5", new_callable=AsyncMock, return_value="abc") as spy_md5:
+             patch.object(s3, "_calculate_md5", new_callable=AsyncMock, return_value="ab" * 16) as spy_md5:
             ok = await s3.upload_file(local, "key")
             assert ok is True
             spy_md5.assert_awaited_once()
@@ -87,6 +87,53 @@ class TestPrecomputedMd5:
             call_kwargs = mock_client.put_object.call_args[1]
             assert call_kwargs["Metadata"]["md5-checksum"] == expected_md5
 
+    async def test_upload_sends_content_md5_and_skips_head(self, explicit_creds_config, tmp_path):
+        """S3 verifies the body against ContentMD5, so no HEAD follows a successful PUT."""
+        import base64
+        import hashlib
+
+        local = tmp_path / "f.txt"
+        local.write_bytes(b"data")
+        digest = hashlib.md5(b"data")
+        s3 = S3Manager(explicit_creds_config)
+        mock_client = AsyncMock()
+        mock_client.put_object.return_value = {"ETag": "x"}
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            ok = await s3.upload_file(local, "key", precomputed_md5=digest.hexdigest())
+        assert ok is True
+        assert mock_client.put_object.call_args[1]["ContentMD5"] == base64.b64encode(digest.digest()).decode()
+        mock_client.head_object.assert_not_called()
+
+    async def test_upload_stats_file_once(self, explicit_creds_config, tmp_path):
+        """Existence check, size branch and metadata all reuse a single stat()."""
+        from pathlib import Path
+
+        local = tmp_path / "f.txt"
+        local.write_bytes(b"data")
+        s3 = S3Manager(explicit_creds_config)
+        mock_client = AsyncMock()
+        mock_client.put_object.return_value = {"ETag": "x"}
+        real_stat = Path.stat
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client), \
+             patch.object(Path, "stat", autospec=True, side_effect=real_stat) as spy_stat:
+            ok = await s3.upload_file(local, "key", precomputed_md5="ff" * 16)
+        assert ok is True
+        assert spy_stat.call_count == 1
+        assert mock_client.put_object.call_args[1]["Metadata"]["file-size"] == "4"
+
+    async def test_upload_fails_when_put_rejected(self, explicit_creds_config, tmp_path):
+        """A BadDigest rejection from S3 is reported as a failed upload."""
+        local = tmp_path / "f.txt"
+        local.write_bytes(b"data")
+        s3 = S3Manager(explicit_creds_config)
+        mock_client = AsyncMock()
+        mock_client.put_object.side_effect = ClientError(
+            {"Error": {"Code": "BadDigest", "Message": "digest mismatch"}}, "PutObject"
+        )
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            ok = await s3.upload_file(local, "key", precomputed_md5="ff" * 16)
+        assert ok is False
+
 
 class TestCredentialChainClientWiring:
     """CONFIG-05 (client side): credential chain controls create_client kwargs."""
@@ -134,6 +181,36 @@ class TestCredentialChainClientWiring:
             assert "aws_access_key_id" not in kwargs
             assert "aws_secret_access_key" not in kwargs
 
+    async def test_initialize_warms_persistent_client(self, explicit_creds_config):
+        """initialize() creates the shared client once; later calls reuse it."""
+        s3 = S3Manager(explicit_creds_config)
+        fake_client = AsyncMock()
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(return_value=fake_client)
+        cm.__aexit__ = AsyncMock(return_value=False)
+        with patch.object(s3._session, "create_client", return_value=cm) as mock_create:
+            await s3.initialize()
+            assert await s3._get_or_create_client() is fake_client
+        mock_create.assert_called_once()
+        fake_client.head_bucket.assert_awaited_once_with(Bucket="test-bucket")
+
+    def test_client_config_keepalive_and_adaptive_retries(self, explicit_creds_config):
+        s3 = S3Manager(explicit_creds_config)
+        assert s3._client_config.tcp_keepalive is True
+        assert s3._client_config.retries["mode"] == "adaptive"
+
+    def test_pool_size_follows_upload_concurrency(self):
+        from aws_copier.core.s3_manager import CHECK_EXISTS_CONCURRENCY, MIN_POOL_CONNECTIONS, MULTIPART_CONCURRENCY
+
+        assert S3Manager(SimpleConfig())._client_config.max_pool_connections == MIN_POOL_CONNECTIONS
+        config = SimpleConfig(max_concurrent_uploads=200, max_concurrent_large_uploads=10)
+        expected = 200 + 10 * MULTIPART_CONCURRENCY + CHECK_EXISTS_CONCURRENCY
+        assert S3Manager(config)._client_config.max_pool_connections == expected
+
+    def test_pool_size_explicit_overrides(self):
+        assert S3Manager(SimpleConfig(max_pool_connections=42))._client_config.max_pool_connections == 42
+        assert S3Manager(SimpleConfig(), max_pool_connections=7)._client_config.max_pool_connections == 7
+
 
 class TestEnsureLifecycleRule:
     """CONFIG-07: ensure_lifecycle_rule covers all D-11 / D-12 branches."""
@@ -234,3 +311,375 @@ class TestEnsureLifecycleRule:
         with patch.object(s3, "_get_or_create_client", return_value=mock_client):
             # Must not raise — D-11
             await s3.ensure_lifecycle_rule()
+
+
+class TestCheckExistsMany:
+    """Bulk HEAD checks run concurrently and map each key to its check_exists result."""
+
+    async def test_maps_each_key_to_result(self, explicit_creds_config):
+        s3 = S3Manager(explicit_creds_config)
+        results = {"a": True, "b": False}
+
+        async def fake_check(key, md5):
+            return results[key]
+
+        with patch.object(s3, "check_exists", side_effect=fake_check) as spy:
+            out = await s3.check_exists_many({"a": "m1", "b": "m2"})
+        assert out == {"a": True, "b": False}
+        assert spy.call_count == 2
+
+    async def test_exception_counts_as_missing(self, explicit_creds_config):
+        s3 = S3Manager(explicit_creds_config)
+        with patch.object(s3, "check_exists", new_callable=AsyncMock, side_effect=RuntimeError("boom")):
+            out = await s3.check_exists_many({"a": "m1"})
+        assert out == {"a": False}
+
+    async def test_respects_max_concurrency(self, explicit_creds_config):
+        import asyncio
+
+        s3 = S3Manager(explicit_creds_config)
+        in_flight = 0
+        peak = 0
+
+        async def slow_check(key, md5):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return False
+
+        with patch.object(s3, "check_exists", side_effect=slow_check), \
+             patch.object(s3, "build_index", new_callable=AsyncMock):
+            await s3.check_exists_many({f"k{i}": "m" for i in range(20)}, max_concurrency=4)
+        assert peak <= 4
+
+
+class TestParallelMultipart:
+    """Multipart parts upload concurrently through a bounded sliding window, completed in part order."""
+
+    async def test_parts_overlap_and_complete_in_order(self, explicit_creds_config, tmp_path):
+        import asyncio
+
+        from aws_copier.core import s3_manager as s3m
+
+        local = tmp_path / "big.bin"
+        local.write_bytes(b"x" * (1024 * 1024 * 6 + 10))  # 7 parts of 1 MiB
+        s3 = S3Manager(explicit_creds_config)
+        in_flight = 0
+        peak = 0
+
+        async def fake_upload_part(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Later parts finish first so completion order differs from part order
+            await asyncio.sleep(0.01 * (8 - kwargs["PartNumber"]))
+            in_flight -= 1
+            return {"ETag": f'"e{kwargs["PartNumber"]}"'}
+
+        mock_client = AsyncMock()
+        mock_client.create_multipart_upload.return_value = {"UploadId": "u1"}
+        mock_client.upload_part.side_effect = fake_upload_part
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client), \
+             patch.object(s3m, "MULTIPART_PART_SIZE", 1024 * 1024):
+            ok = await s3._upload_large_file(local, "key", "ff" * 16)
+
+        assert ok is True
+        assert 1 < peak <= s3m.MULTIPART_CONCURRENCY
+        parts = mock_client.complete_multipart_upload.call_args.kwargs["MultipartUpload"]["Parts"]
+        assert [p["PartNumber"] for p in parts] == list(range(1, 8))
+        assert parts[0]["ETag"] == '"e1"'
+        mock_client.abort_multipart_upload.assert_not_called()
+
+    async def test_chunk_reads_run_off_the_event_loop(self, explicit_creds_config, tmp_path):
+        import threading
+
+        local = tmp_path / "big.bin"
+        local.write_bytes(b"x" * (1024 * 1024 * 2 + 1))
+        s3 = S3Manager(explicit_creds_config)
+        read_threads = []
+
+        async def record_upload_part(**kwargs):
+            return {"ETag": '"e"'}
+
+        real_open = open
+
+        def tracking_open(*args, **kwargs):
+            fh = real_open(*args, **kwargs)
+            real_read = fh.read
+
+            def read(n=-1):
+                read_threads.append(threading.current_thread())
+                return real_read(n)
+
+            fh.read = read
+            return fh
+
+        mock_client = AsyncMock()
+        mock_client.create_multipart_upload.return_value = {"UploadId": "u1"}
+        mock_client.upload_part.side_effect = record_upload_part
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client), \
+             patch("aws_copier.core.s3_manager.MULTIPART_PART_SIZE", 1024 * 1024), \
+             patch("builtins.open", tracking_open):
+            ok = await s3._upload_large_file(local, "key", "ff" * 16)
+
+        assert ok is True
+        assert read_threads
+        assert threading.main_thread() not in read_threads
+
+    async def test_failed_part_aborts_upload(self, explicit_creds_config, tmp_path):
+        local = tmp_path / "big.bin"
+        local.write_bytes(b"x" * (1024 * 1024 * 2 + 1))
+        s3 = S3Manager(explicit_creds_config)
+
+        async def failing_upload_part(**kwargs):
+            if kwargs["PartNumber"] == 2:
+                raise RuntimeError("part failed")
+            return {"ETag": '"e"'}
+
+        mock_client = AsyncMock()
+        mock_client.create_multipart_upload.return_value = {"UploadId": "u1"}
+        mock_client.upload_part.side_effect = failing_upload_part
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client), \
+             patch("aws_copier.core.s3_manager.MULTIPART_PART_SIZE", 1024 * 1024):
+            ok = await s3._upload_large_file(local, "key", "ff" * 16)
+
+        assert ok is False
+        mock_client.abort_multipart_upload.assert_awaited_once()
+        mock_client.complete_multipart_upload.assert_not_called()
+
+
+class TestMultipartPartSize:
+    """Part size starts at MULTIPART_PART_SIZE and grows to keep huge files under the part limit."""
+
+    def test_default_for_ordinary_large_files(self):
+        from aws_copier.core.s3_manager import MULTIPART_PART_SIZE, multipart_part_size
+
+        assert multipart_part_size(200 * 1024 * 1024) == MULTIPART_PART_SIZE
+        assert multipart_part_size(10 * 1024**3) == MULTIPART_PART_SIZE
+
+    def test_grows_for_huge_files(self):
+        from aws_copier.core.s3_manager import MULTIPART_MAX_PARTS, multipart_part_size
+
+        size = 1024**4  # 1 TiB
+        part = multipart_part_size(size)
+        assert part % (1024 * 1024) == 0
+        assert -(-size // part) <= MULTIPART_MAX_PARTS
+
+
+class TestKeyIndex:
+    """build_index lists a prefix once so check_exists can skip HEADs while the listing is fresh."""
+
+    @staticmethod
+    def _client_with_pages(*pages):
+        mock_client = AsyncMock()
+        mock_client.list_objects_v2.side_effect = list(pages)
+        return mock_client
+
+    async def test_build_index_paginates(self, explicit_creds_config):
+        s3 = S3Manager(explicit_creds_config)
+        mock_client = self._client_with_pages(
+            {
+                "Contents": [{"Key": "test-prefix/a", "Size": 1, "ETag": '"e1"'}],
+                "IsTruncated": True,
+                "NextContinuationToken": "t1",
+            },
+            {"Contents": [{"Key": "test-prefix/b", "Size": 2, "ETag": '"e2"'}], "IsTruncated": False},
+        )
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            listed = await s3.build_index()
+        assert listed == {"test-prefix/a": {"size": 1, "etag": "e1"}, "test-prefix/b": {"size": 2, "etag": "e2"}}
+        first, second = mock_client.list_objects_v2.call_args_list
+        assert first.kwargs["Prefix"] == "test-prefix/"
+        assert second.kwargs["ContinuationToken"] == "t1"
+
+    async def test_check_exists_served_from_index(self, explicit_creds_config):
+        s3 = S3Manager(explicit_creds_config)
+        mock_client = self._client_with_pages(
+            {"Contents": [{"Key": "test-prefix/dir/a", "Size": 1, "ETag": '"' + "aa" * 16 + '"'}]},
+        )
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            await s3.build_index("dir/")
+            assert await s3.check_exists("dir/a", "aa" * 16) is True
+            assert await s3.check_exists("dir/missing", "bb" * 16) is False
+        mock_client.head_object.assert_not_called()
+
+    async def test_inconclusive_entries_fall_back_to_head(self, explicit_creds_config):
+        s3 = S3Manager(explicit_creds_config)
+        mock_client = self._client_with_pages(
+            {"Contents": [{"Key": "test-prefix/big", "Size": 1, "ETag": '"abc-3"'}]},
+        )
+        mock_client.head_object.return_value = {"Metadata": {"md5-checksum": "cc" * 16}}
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            await s3.build_index()
+            assert await s3.check_exists("big", "cc" * 16) is True
+            # Outside the indexed prefix: HEAD as before
+            s3._key_index = {"test-prefix/other/": s3._key_index["test-prefix/"]}
+            assert await s3.check_exists("big", "cc" * 16) is True
+        assert mock_client.head_object.await_count == 2
+
+    async def test_expired_index_is_ignored(self, explicit_creds_config):
+        from aws_copier.core import s3_manager as s3m
+
+        s3 = S3Manager(explicit_creds_config)
+        mock_client = self._client_with_pages({"Contents": []})
+        mock_client.head_object.return_value = {"Metadata": {"md5-checksum": "aa" * 16}}
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            with patch.object(s3m, "KEY_INDEX_TTL_SECONDS", 0):
+                await s3.build_index()
+            assert await s3.check_exists("a", "aa" * 16) is True
+        mock_client.head_object.assert_awaited_once()
+
+    async def test_expired_listing_is_evicted(self, explicit_creds_config):
+        from aws_copier.core import s3_manager as s3m
+
+        s3 = S3Manager(explicit_creds_config)
+        mock_client = self._client_with_pages(
+            {"Contents": [{"Key": "test-prefix/old/a", "Size": 1, "ETag": '"e1"'}]},
+            {"Contents": [{"Key": "test-prefix/new/b", "Size": 2, "ETag": '"e2"'}]},
+        )
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            with patch.object(s3m, "KEY_INDEX_TTL_SECONDS", 0):
+                await s3.build_index("old/", recursive=False)
+            await s3.build_index("new/", recursive=False)
+        # Building a new listing drops the expired one together with all its keys
+        assert list(s3._key_index) == ["test-prefix/new/"]
+
+        # A lookup that meets an expired listing evicts it on the spot
+        _, recursive, keys = s3._key_index["test-prefix/new/"]
+        s3._key_index["test-prefix/new/"] = (0.0, recursive, keys)
+        assert s3._index_covers("test-prefix/new/b") is False
+        assert s3._key_index == {}
+
+    async def test_recursive_ancestor_listing_covers_nested_keys(self, explicit_creds_config):
+        s3 = S3Manager(explicit_creds_config)
+        nested = "test-prefix/dir/sub/a"
+        mock_client = self._client_with_pages({"Contents": [{"Key": nested, "Size": 1, "ETag": '"' + "aa" * 16 + '"'}]})
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            await s3.build_index()
+            assert await s3.check_exists("dir/sub/a", "aa" * 16) is True
+            assert await s3.check_exists("dir/sub/missing", "aa" * 16) is False
+        mock_client.head_object.assert_not_called()
+
+    async def test_upload_updates_index(self, explicit_creds_config, tmp_path):
+        local = tmp_path / "f.txt"
+        local.write_bytes(b"data")
+        s3 = S3Manager(explicit_creds_config)
+        mock_client = self._client_with_pages({"Contents": []})
+        mock_client.put_object.return_value = {"ETag": "x"}
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            await s3.build_index()
+            assert await s3.upload_file(local, "f.txt", precomputed_md5="dd" * 16) is True
+            assert await s3.check_exists("f.txt", "dd" * 16) is True
+        mock_client.head_object.assert_not_called()
+
+    async def test_non_recursive_index_skips_nested_keys(self, explicit_creds_config):
+        s3 = S3Manager(explicit_creds_config)
+        mock_client = self._client_with_pages({"Contents": []})
+        mock_client.head_object.return_value = {"Metadata": {"md5-checksum": "aa" * 16}}
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            await s3.build_index("dir/", recursive=False)
+            assert await s3.check_exists("dir/a", "aa" * 16) is False
+            assert await s3.check_exists("dir/sub/a", "aa" * 16) is True
+        assert mock_client.list_objects_v2.call_args.kwargs["Delimiter"] == "/"
+        mock_client.head_object.assert_awaited_once()
+
+    async def test_check_exists_many_lists_folder_once(self, explicit_creds_config):
+        from aws_copier.core.s3_manager import KEY_INDEX_MIN_KEYS
+
+        s3 = S3Manager(explicit_creds_config)
+        existing = "aa" * 16
+        mock_client = self._client_with_pages(
+            {"Contents": [{"Key": "test-prefix/dir/f0", "Size": 1, "ETag": f'"{existing}"'}]},
+        )
+        keys = {f"dir/f{i}": existing for i in range(KEY_INDEX_MIN_KEYS)}
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            out = await s3.check_exists_many(keys)
+            # A second batch in the same folder reuses the fresh listing
+            await s3.check_exists_many(keys)
+        assert out["dir/f0"] is True
+        assert sum(out.values()) == 1
+        mock_client.list_objects_v2.assert_awaited_once()
+        assert mock_client.list_objects_v2.call_args.kwargs["Prefix"] == "test-prefix/dir/"
+        mock_client.head_object.assert_not_called()
+
+    async def test_check_exists_many_evicts_expired_folder_listing(self, explicit_creds_config):
+        from aws_copier.core import s3_manager as s3m
+
+        s3 = S3Manager(explicit_creds_config)
+        mock_client = self._client_with_pages({"Contents": []}, {"Contents": []})
+        mock_client.head_object.side_effect = AssertionError("listed keys must not be HEADed")
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            with patch.object(s3m, "KEY_INDEX_TTL_SECONDS", 0):
+                await s3.check_exists_many({f"a/f{i}": "aa" * 16 for i in range(s3m.KEY_INDEX_MIN_KEYS)})
+            await s3.check_exists_many({f"b/f{i}": "aa" * 16 for i in range(s3m.KEY_INDEX_MIN_KEYS)})
+        # Listing folder b dropped the expired listing of folder a instead of accumulating it
+        assert list(s3._key_index) == ["test-prefix/b/"]
+
+    async def test_check_exists_many_abandons_large_listing(self, explicit_creds_config):
+        from aws_copier.core import s3_manager as s3m
+
+        s3 = S3Manager(explicit_creds_config)
+        assert s3m.KEY_INDEX_MIN_KEYS * s3m.KEY_INDEX_MAX_OBJECTS_PER_KEY == 1000
+
+        def page(n):
+            objects = [{"Key": f"test-prefix/dir/x{n}-{i}", "Size": 1, "ETag": '"e"'} for i in range(1000)]
+            return {"Contents": objects, "IsTruncated": True, "NextContinuationToken": f"t{n}"}
+
+        # A remote folder far larger than the batch: the listing stops once past the cap
+        mock_client = self._client_with_pages(*(page(n) for n in range(100)))
+        mock_client.head_object.return_value = {"ETag": '"' + "aa" * 16 + '"'}
+        keys = {f"dir/f{i}": "aa" * 16 for i in range(s3m.KEY_INDEX_MIN_KEYS)}
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            out = await s3.check_exists_many(keys)
+
+        assert all(out.values())
+        # Page 1 reaches the 1000-object cap, page 2 exceeds it; the other 98 are never fetched
+        assert mock_client.list_objects_v2.await_count == 2
+        assert mock_client.head_object.await_count == len(keys)
+        assert s3._key_index == {}
+
+    async def test_check_exists_many_small_batch_uses_head(self, explicit_creds_config):
+        s3 = S3Manager(explicit_creds_config)
+        mock_client = AsyncMock()
+        mock_client.head_object.return_value = {"ETag": '"' + "aa" * 16 + '"'}
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            out = await s3.check_exists_many({"dir/a": "aa" * 16, "dir/b": "aa" * 16})
+        assert out == {"dir/a": True, "dir/b": True}
+        mock_client.list_objects_v2.assert_not_called()
+
+    async def test_list_error_leaves_index_empty(self, explicit_creds_config):
+        s3 = S3Manager(explicit_creds_config)
+        mock_client = AsyncMock()
+        mock_client.list_objects_v2.side_effect = RuntimeError("boom")
+        with patch.object(s3, "_get_or_create_client", return_value=mock_client):
+            assert await s3.build_index() == {}
+        assert s3._key_index == {}
+
+
+class TestCheckExistsEtagFastPath:
+    """A simple-upload ETag equal to the expected MD5 answers check_exists without the metadata."""
+
+    @staticmethod
+    def _manager_with_head(config, response):
+        s3 = S3Manager(config)
+        mock_client = AsyncMock()
+        mock_client.head_object.return_value = response
+        s3._s3_client = mock_client
+        return s3
+
+    async def test_matching_etag_without_metadata(self, explicit_creds_config):
+        s3 = self._manager_with_head(explicit_creds_config, {"ETag": '"' + "aa" * 16 + '"', "Metadata": {}})
+        assert await s3.check_exists("k", "aa" * 16) is True
+
+    async def test_non_md5_etag_defers_to_metadata(self, explicit_creds_config):
+        """SSE-KMS ETags are not MD5s; the stored md5-checksum still decides."""
+        response = {"ETag": '"' + "ee" * 16 + '"', "Metadata": {"md5-checksum": "aa" * 16}}
+        s3 = self._manager_with_head(explicit_creds_config, response)
+        assert await s3.check_exists("k", "aa" * 16) is True
+        assert await s3.check_exists("k", "bb" * 16) is False
+
+    async def test_mismatching_etag_without_metadata(self, explicit_creds_config):
+        s3 = self._manager_with_head(explicit_creds_config, {"ETag": '"' + "ee" * 16 + '"', "Metadata": {}})
+        assert await s3.check_exists("k", "aa" * 16) is False
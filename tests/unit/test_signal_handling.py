@@ -161,6 +161,13 @@ class TestShutdownDrain:
         app.folder_watcher.stop.assert_awaited_once()
         app.s3_manager.close.assert_awaited_once()
 
+    async def test_shutdown_releases_hash_pool(self, app):
+        """Shutdown releases the shared MD5 thread pool so no hashing threads outlive the app."""
+        app.file_listener._active_upload_tasks = set()
+        with patch("main.shutdown_hash_pool") as mock_shutdown_pool:
+            await app.shutdown()
+        mock_shutdown_pool.assert_called_once_with()
+
     async def test_shutdown_is_idempotent(self, app):
         """Calling shutdown twice (signal handler + finally) must short-circuit the second call."""
         app.file_listener._active_upload_tasks = set()
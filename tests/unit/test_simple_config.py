@@ -238,6 +238,36 @@ def test_discovered_files_folder_removed():
     assert "discovered_files_folder" not in config.to_dict()
 
 
+def test_max_pool_connections_default_and_override():
+    """max_pool_connections defaults to 0 (auto) and negative values are clamped to auto."""
+    assert SimpleConfig().max_pool_connections == 0
+    assert SimpleConfig(max_pool_connections=250).max_pool_connections == 250
+    assert SimpleConfig(max_pool_connections=-5).max_pool_connections == 0
+
+
+def test_scan_workers_default_and_override():
+    """scan_workers defaults to 4 and is clamped to at least one worker."""
+    assert SimpleConfig().scan_workers == 4
+    assert SimpleConfig(scan_workers=8).scan_workers == 8
+    assert SimpleConfig(scan_workers=0).scan_workers == 1
+
+
+def test_max_concurrent_large_uploads_default_and_override():
+    """max_concurrent_large_uploads defaults to 4 and is clamped to at least one."""
+    assert SimpleConfig().max_concurrent_large_uploads == 4
+    assert SimpleConfig(max_concurrent_large_uploads=2).max_concurrent_large_uploads == 2
+    assert SimpleConfig(max_concurrent_large_uploads=0).max_concurrent_large_uploads == 1
+
+
+def test_watch_backend_default_and_override():
+    """watch_backend defaults to native, accepts polling, and falls back on unknown values."""
+    assert SimpleConfig().watch_backend == "native"
+    assert SimpleConfig(watch_backend="Polling").watch_backend == "polling"
+    assert SimpleConfig(watch_backend="fanotify").watch_backend == "native"
+    assert SimpleConfig().watch_poll_interval == 5
+    assert SimpleConfig(watch_poll_interval=0).watch_poll_interval == 0.5
+
+
 def test_legacy_config_with_discovered_files_folder_ignored(tmp_path):
     """CONFIG-03: loading an old YAML with discovered_files_folder field still works."""
     legacy_yaml = tmp_path / "legacy.yaml"
@@ -10,7 +10,7 @@ import pytest
 from botocore.exceptions import ClientError
 
 from aws_copier.models.simple_config import SimpleConfig
-from upload_large import LargeFileUploader, _format_bytes, _part_timeout
+from upload_large import LargeFileUploader, _format_bytes, _list_files, _part_timeout
 
 
 # ---------------------------------------------------------------------------
@@ -394,3 +394,25 @@ async def test_upload_folder_recurse_preserves_prefix(tmp_path):
         await uploader.upload_folder(tmp_path, "backup")
 
     assert captured_keys == ["backup/photos/2026/img.jpg"]
+
+
+def test_list_files_returns_sorted_regular_files_with_sizes(tmp_path):
+    (tmp_path / "b.bin").write_bytes(b"bb")
+    sub = tmp_path / "a"
+    sub.mkdir()
+    (sub / "c.bin").write_bytes(b"ccc")
+    (tmp_path / "empty_dir").mkdir()
+
+    assert _list_files(tmp_path) == [(sub / "c.bin", 3), (tmp_path / "b.bin", 2)]
+
+
+def test_list_files_skips_symlinked_directories(tmp_path):
+    real = tmp_path / "real"
+    real.mkdir()
+    (real / "f.bin").write_bytes(b"f")
+    try:
+        (tmp_path / "link").symlink_to(real, target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("Symlinks not supported on this platform")
+
+    assert _list_files(tmp_path) == [(real / "f.bin", 1)]
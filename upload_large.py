@@ -10,6 +10,8 @@ import asyncio
 import contextlib
 import hashlib
 import logging
+import os
+import stat
 import sys
 import time
 from pathlib import Path
@@ -44,6 +46,35 @@ def _format_bytes(n: int) -> str:
     return f"{n:.1f} PB"
 
 
+def _list_files(folder: Path) -> List[Tuple[Path, int]]:
+    """Return (path, size) for every regular file under *folder*, sorted by path.
+
+    Iterative os.scandir walk: DirEntry.is_dir(follow_symlinks=False) comes from the
+    directory listing itself, so only files cost a stat (served from the listing on
+    Windows). Symlinked directories are not descended into (as with rglob); symlinks
+    to files are followed.
+    """
+    found: List[Tuple[Path, int]] = []
+    stack = [str(folder)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    if stat.S_ISREG(st.st_mode):
+                        found.append((Path(entry.path), st.st_size))
+        except OSError as e:
+            logger.warning(f"Cannot list {e.filename}: {e.strerror}")
+    found.sort()
+    return found
+
+
 class LargeFileUploader:
     """Uploads large files to S3 using concurrent multipart upload with per-part retry."""
 
@@ -318,12 +349,14 @@ class LargeFileUploader:
         Returns:
             True if all files succeeded.
         """
-        files = sorted(p for p in folder.rglob("*") if p.is_file())
-        if not files:
+        # Walk off the event loop: a large tree can take seconds to list
+        listing = await asyncio.to_thread(_list_files, folder)
+        if not listing:
             print(f"No files found in {folder}")
             return True
 
-        total_size = sum(p.stat().st_size for p in files)
+        files = [fp for fp, _ in listing]
+        total_size = sum(size for _, size in listing)
         print(f"Found {len(files)} file(s) — total {_format_bytes(total_size)}")
 
         start = time.monotonic()